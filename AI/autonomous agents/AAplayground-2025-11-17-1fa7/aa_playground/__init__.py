@@ -1,7 +1,7 @@
 """Autonomous Agents Playground package."""
 
 from .agents import BaseAgent, BreadthFirstNavigator, KeyboardDroneAgent
-from .core import Action, ActionType, Direction
+from .core import WAIT_ACTION, Action, ActionType, Direction
 from .environment import (
     AgentState,
     CropStage,
@@ -43,4 +43,5 @@ __all__ = [
     "Tile",
     "TileView",
     "TreeSprites",
+    "WAIT_ACTION",
 ]
@@ -8,9 +8,9 @@ Description: Agent base classes and reference implementations for the playground
 from __future__ import annotations
 
 from collections import deque
-from typing import Deque, Dict, Optional, Tuple, TYPE_CHECKING
+from typing import Deque, List, Optional, Tuple, TYPE_CHECKING
 
-from .core import Action, ActionType, Direction
+from .core import _DELTA_TO_DIR, _DELTA_VALUES, WAIT_ACTION, Action, ActionType, Direction
 
 if TYPE_CHECKING:  # pragma: no cover - type checking aid
     from .environment import Observation
@@ -51,7 +51,7 @@ class BaseAgent:
 
         By default the agent waits in place.
         """
-        return Action(ActionType.WAIT)
+        return WAIT_ACTION
 
 
 class KeyboardDroneAgent(BaseAgent):
@@ -87,7 +87,7 @@ class KeyboardDroneAgent(BaseAgent):
         """
         Pop the oldest queued action or wait when no input is available.
         """
-        return self._queued_actions.popleft() if self._queued_actions else Action(ActionType.WAIT)
+        return self._queued_actions.popleft() if self._queued_actions else WAIT_ACTION
 
 
 class BreadthFirstNavigator(BaseAgent):
@@ -97,10 +97,16 @@ class BreadthFirstNavigator(BaseAgent):
 
     def __init__(self, name: str = "Navigator") -> None:
         """
-        Initialise the agent and the reusable path buffer.
+        Initialise the agent and the reusable path and search buffers.
         """
         super().__init__(name=name)
         self._path: Deque[Direction] = deque()
+        # Search buffers reused across plans. A tile counts as visited when its entry in
+        # `_visited` equals the current `_search_id`, so nothing has to be reset between plans.
+        self._frontier: Deque[int] = deque()
+        self._came_from: List[int] = []
+        self._visited: List[int] = []
+        self._search_id = 0
 
     def decide(self, observation: "Observation") -> Optional[Action]:
         """
@@ -109,10 +115,10 @@ class BreadthFirstNavigator(BaseAgent):
         if not self._path:
             goal = self._locate_goal(observation)
             if goal is None:
-                return Action(ActionType.WAIT)
+                return WAIT_ACTION
             self._path = self._plan_path(observation, goal)
         if not self._path:
-            return Action(ActionType.WAIT)
+            return WAIT_ACTION
         direction = self._path.popleft()
         return Action(ActionType.MOVE, direction=direction)
 
@@ -120,8 +126,8 @@ class BreadthFirstNavigator(BaseAgent):
         """
         Identify the goal tile location from the observation metadata.
         """
-        for position, tile in observation.tiles.items():
-            if tile.get("terrain") == "goal":
+        for position, terrain in observation.terrain.items():
+            if terrain == "goal":
                 return position
         return None
 
@@ -133,46 +139,91 @@ class BreadthFirstNavigator(BaseAgent):
         if start == goal:
             return deque()
 
-        frontier: Deque[Tuple[int, int]] = deque([start])
-        came_from: Dict[Tuple[int, int], Tuple[int, int]] = {start: start}
-
-        while frontier:
+        width = observation.width
+        height = observation.height
+        if not (0 <= goal[0] < width and 0 <= goal[1] < height):
+            return deque()
+        walkable = self._walkable_mask(observation, goal)
+
+        # Tiles are addressed by row-major index `y * width + x`; `came_from` holds the
+        # predecessor index of every visited tile.
+        size = width * height
+        if len(self._visited) != size:
+            self._came_from = [0] * size
+            self._visited = [0] * size
+            self._search_id = 0
+        self._search_id += 1
+        search_id = self._search_id
+        came_from = self._came_from
+        visited = self._visited
+
+        start_index = start[1] * width + start[0]
+        goal_index = goal[1] * width + goal[0]
+        frontier = self._frontier
+        frontier.clear()
+        frontier.append(start_index)
+        came_from[start_index] = start_index
+        visited[start_index] = search_id
+
+        # Tiles are marked visited when enqueued, so the goal's predecessor is fixed
+        # the moment it is discovered and the search can stop right there.
+        goal_found = False
+        while frontier and not goal_found:
             current = frontier.popleft()
-            if current == goal:
-                break
-            for direction in Direction:
-                dx, dy = direction.delta()
-                neighbor = (current[0] + dx, current[1] + dy)
-                tile_dict = observation.tiles.get(neighbor)
-                if tile_dict is None:
+            cy, cx = divmod(current, width)
+            for dx, dy in _DELTA_VALUES:
+                nx = cx + dx
+                ny = cy + dy
+                if not (0 <= nx < width and 0 <= ny < height):
                     continue
-                terrain = tile_dict.get("terrain", "")
-                # Tile is walkable if it's not an obstacle
-                is_walkable = terrain not in ("obstacle", "base")
-                if neighbor not in came_from and (is_walkable or neighbor == goal):
+                neighbor = ny * width + nx
+                if walkable[neighbor] and visited[neighbor] != search_id:
+                    visited[neighbor] = search_id
                     came_from[neighbor] = current
+                    if neighbor == goal_index:
+                        goal_found = True
+                        break
                     frontier.append(neighbor)
 
-        if goal not in came_from:
+        if not goal_found:
             return deque()
 
         path: Deque[Direction] = deque()
-        current = goal
-        while current != start:
+        current = goal_index
+        while current != start_index:
             previous = came_from[current]
-            path.appendleft(self._direction_from_delta(previous, current))
+            py, px = divmod(previous, width)
+            cy, cx = divmod(current, width)
+            path.appendleft(self._direction_from_delta((px, py), (cx, cy)))
             current = previous
         return path
 
+    @staticmethod
+    def _walkable_mask(observation: "Observation", goal: Tuple[int, int]) -> bytearray:
+        """
+        Flatten the observed tiles into a row-major walkability mask.
+
+        Unobserved tiles stay blocked; an observed goal is always enterable.
+        """
+        width = observation.width
+        height = observation.height
+        walkable = bytearray(width * height)
+        for position, terrain in observation.terrain.items():
+            x, y = position
+            if not (0 <= x < width and 0 <= y < height):
+                continue
+            # Tile is walkable if it's not an obstacle
+            if position == goal or terrain not in ("obstacle", "base"):
+                walkable[y * width + x] = 1
+        return walkable
+
     @staticmethod
     def _direction_from_delta(start: Tuple[int, int], end: Tuple[int, int]) -> Direction:
         """
         Convert the difference between two adjacent tiles into a direction enum value.
         """
-        dx = end[0] - start[0]
-        dy = end[1] - start[1]
-        for direction in Direction:
-            ddx, ddy = direction.delta()
-            if (dx, dy) == (ddx, ddy):
-                return direction
-        raise ValueError(f"No direction matches delta {(dx, dy)}")  # pragma: no cover - defensive guard
+        delta = (end[0] - start[0], end[1] - start[1])
+        direction = _DELTA_TO_DIR.get(delta)
+        if direction is None:
+            raise ValueError(f"No direction matches delta {delta}")  # pragma: no cover - defensive guard
+        return direction
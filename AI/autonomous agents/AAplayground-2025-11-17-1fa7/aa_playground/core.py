@@ -22,15 +22,18 @@ class Direction(Enum):
 
     def delta(self) -> Tuple[int, int]:
         """Return the `(dx, dy)` delta associated with the direction."""
-        if self is Direction.UP:
-            return (0, -1)
-        if self is Direction.DOWN:
-            return (0, 1)
-        if self is Direction.LEFT:
-            return (-1, 0)
-        if self is Direction.RIGHT:
-            return (1, 0)
-        raise ValueError(f"Unhandled direction: {self}")  # pragma: no cover - defensive guard
+        return _DELTAS[self]
+
+
+# Lookup tables shared by the movement and search code, in `Direction` iteration order.
+_DELTAS: Dict[Direction, Tuple[int, int]] = {
+    Direction.UP: (0, -1),
+    Direction.DOWN: (0, 1),
+    Direction.LEFT: (-1, 0),
+    Direction.RIGHT: (1, 0),
+}
+_DELTA_VALUES: Tuple[Tuple[int, int], ...] = tuple(_DELTAS.values())
+_DELTA_TO_DIR: Dict[Tuple[int, int], Direction] = {delta: direction for direction, delta in _DELTAS.items()}
 
 
 class ActionType(Enum):
@@ -46,7 +49,7 @@ class ActionType(Enum):
     HARVEST = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Action:
     """Request issued by an agent to the environment."""
 
@@ -59,11 +62,18 @@ class Action:
         """
         Return a copy of the action with the supplied metadata merged in.
 
+        The action itself is returned when no metadata is supplied.
+
         Parameters
         ----------
         **kwargs:
             Additional metadata values to attach to the action.
         """
-        merged: Dict[str, object] = dict(self.metadata or {})
-        merged.update(kwargs)
+        if not kwargs:
+            return self
+        merged: Dict[str, object] = {**self.metadata, **kwargs} if self.metadata else kwargs
         return Action(type=self.type, direction=self.direction, item=self.item, metadata=merged)
+
+
+# Shared idle action; `Action` is immutable, so one instance serves every waiting agent.
+WAIT_ACTION = Action(ActionType.WAIT)
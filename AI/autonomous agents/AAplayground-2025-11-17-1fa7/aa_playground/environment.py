@@ -9,26 +9,34 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+from functools import cached_property
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple, TYPE_CHECKING
 
-from .core import Action, ActionType, Direction
+from .core import _DELTA_VALUES, WAIT_ACTION, Action, ActionType, Direction
 
 if TYPE_CHECKING:  # pragma: no cover - type checking aid
     from .agents import BaseAgent
 
 
-@dataclass
+@dataclass(slots=True)
 class Tile:
     """Mutable representation of a single grid cell."""
 
     terrain: str = "plain"
     blocking: bool = False
     items: Dict[str, int] = field(default_factory=dict)
-    agents: List[int] = field(default_factory=list)
+    # Occupied tiles are not walkable, so a tile never holds more than one agent.
+    occupant: Optional[int] = None
+
+    @property
+    def agents(self) -> List[int]:
+        """Return the identifiers of the agents standing on the tile."""
+        return [] if self.occupant is None else [self.occupant]
 
     def is_walkable(self) -> bool:
         """Return `True` when the tile can be entered by an agent."""
-        return not self.blocking and not self.agents
+        return not self.blocking and self.occupant is None
 
     def add_item(self, item: str, amount: int = 1) -> None:
         """
@@ -41,9 +49,11 @@ class Tile:
         amount:
             Quantity to add (default `1`).
         """
-        self.items[item] = self.items.get(item, 0) + amount
-        if self.items[item] <= 0:
-            del self.items[item]
+        count = self.items.get(item, 0) + amount
+        if count > 0:
+            self.items[item] = count
+        else:
+            self.items.pop(item, None)
 
     def remove_item(self, item: str, amount: int = 1) -> bool:
         """
@@ -54,15 +64,17 @@ class Tile:
         bool
             `True` when the removal succeeded, `False` otherwise.
         """
-        if self.items.get(item, 0) < amount:
+        count = self.items.get(item, 0)
+        if count < amount:
             return False
-        self.items[item] -= amount
-        if self.items[item] == 0:
+        if count == amount:
             del self.items[item]
+        else:
+            self.items[item] = count - amount
         return True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TileView:
     """Immutable snapshot of a tile presented to an agent."""
 
@@ -81,13 +93,32 @@ class Observation:
     turn: int
     time_remaining: Optional[int]
     position: Tuple[int, int]
-    inventory: Dict[str, int]
-    tiles: Dict[Tuple[int, int], Dict[str, str]]
+    inventory: Mapping[str, int]
+    terrain: Dict[Tuple[int, int], str]
     width: int
     height: int
 
+    @cached_property
+    def tiles(self) -> Dict[Tuple[int, int], Dict[str, str]]:
+        """
+        Return the visible tiles as `{position: {"terrain": terrain}}` dictionaries.
+
+        The nested form is built on first access only; agents that just need the
+        terrain string can read `terrain` directly.
+        """
+        return {position: {"terrain": terrain} for position, terrain in self.terrain.items()}
+
+    def snapshot_inventory(self) -> Dict[str, int]:
+        """
+        Return a private copy of the inventory.
+
+        `inventory` is a read-only live view of the agent's items; agents that keep
+        observations around should store a snapshot instead.
+        """
+        return dict(self.inventory)
+
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     """Runtime state tracked for each registered agent."""
 
@@ -96,27 +127,40 @@ class AgentState:
     controller: "BaseAgent"
     position: Tuple[int, int]
     inventory: Dict[str, int] = field(default_factory=dict)
+    inventory_view: Mapping[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Create the read-only inventory view shared with observations."""
+        self.inventory_view = MappingProxyType(self.inventory)
 
     def add_item(self, item: str, amount: int = 1) -> None:
         """
         Add items to the agent inventory, removing the key when the count reaches zero.
         """
-        self.inventory[item] = self.inventory.get(item, 0) + amount
-        if self.inventory[item] <= 0:
-            del self.inventory[item]
+        count = self.inventory.get(item, 0) + amount
+        if count > 0:
+            self.inventory[item] = count
+        else:
+            self.inventory.pop(item, None)
 
     def remove_item(self, item: str, amount: int = 1) -> bool:
         """
         Remove items from the agent inventory if enough units are available.
         """
-        if self.inventory.get(item, 0) < amount:
+        count = self.inventory.get(item, 0)
+        if count < amount:
             return False
-        self.inventory[item] -= amount
-        if self.inventory[item] == 0:
+        if count == amount:
             del self.inventory[item]
+        else:
+            self.inventory[item] = count - amount
         return True
 
 
+# Soil stage values that are reported to agents unchanged as terrain.
+_SOIL_STAGE_TERRAINS: FrozenSet[str] = frozenset({"seed", "growing", "ready", "weed", "empty"})
+
+
 class GridWorld:
     """Base implementation of a 2D grid world supporting multiple agents."""
 
@@ -136,11 +180,33 @@ class GridWorld:
         self.max_turns = max_turns
         self.turn = 0
 
-        self._grid: List[List[Tile]] = [
-            [Tile() for _ in range(width)] for _ in range(height)
+        # Tiles are stored in a single row-major list: `(x, y)` lives at `y * width + x`.
+        self._tiles: List[Tile] = [Tile() for _ in range(width * height)]
+        # In-bounds 4-connected neighbours of every tile, in `Direction` order.
+        self._neighbors: List[Tuple[Tuple[int, int], ...]] = [
+            tuple(
+                (x + dx, y + dy)
+                for dx, dy in _DELTA_VALUES
+                if 0 <= x + dx < width and 0 <= y + dy < height
+            )
+            for y in range(height)
+            for x in range(width)
         ]
         self._agents: Dict[int, AgentState] = {}
         self._next_agent_id = 1
+        # `tile_metadata` results and the derived terrain strings by row-major index,
+        # dropped whenever the world may have changed.
+        self._metadata_cache: Dict[int, Dict[str, object]] = {}
+        self._terrain_cache: Dict[int, str] = {}
+
+        # Built-in action handlers; other action types go to `handle_custom_action`.
+        self._action_handlers: Dict[ActionType, Callable[[AgentState, Action], None]] = {
+            ActionType.WAIT: self._handle_wait,
+            ActionType.MOVE: self._handle_move,
+            ActionType.PICK_UP: self._handle_pick_up,
+            ActionType.DROP: self._handle_drop,
+            ActionType.USE: self.handle_use,
+        }
 
     def in_bounds(self, position: Tuple[int, int]) -> bool:
         """Return `True` when the supplied position lies inside the grid."""
@@ -149,10 +215,10 @@ class GridWorld:
 
     def get_tile(self, position: Tuple[int, int]) -> Tile:
         """Return the mutable tile instance at the given position."""
-        if not self.in_bounds(position):
-            raise ValueError(f"Position {position} is outside the grid.")
         x, y = position
-        return self._grid[y][x]
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise ValueError(f"Position {position} is outside the grid.")
+        return self._tiles[y * self.width + x]
 
     def scatter_items(self, position: Tuple[int, int], item: str, amount: int = 1) -> None:
         """Convenience helper to deposit resources on a tile."""
@@ -191,7 +257,7 @@ class GridWorld:
             inventory=dict(inventory or {}),
         )
         self._agents[agent_id] = state
-        tile.agents.append(agent_id)
+        tile.occupant = agent_id
         agent.on_registered(agent_id)
         return agent_id
 
@@ -205,15 +271,17 @@ class GridWorld:
         if not self._agents:
             return
 
-        for agent_id in list(self._agents.keys()):
-            state = self._agents.get(agent_id)
-            if state is None:
-                continue
-            observation = self._build_observation(agent_id)
+        time_remaining = self._time_remaining()
+        # Agents are only added through `register_agent`, never while a turn is running,
+        # so the registry can be iterated without taking a copy.
+        for agent_id, state in self._agents.items():
+            observation = self._build_observation(agent_id, time_remaining)
             action = state.controller.decide(observation)
             self.execute_action(agent_id, action)
+            self.invalidate_tile_metadata()
 
         self.after_step()
+        self.invalidate_tile_metadata()
         self.turn += 1
 
     def run(self, steps: Optional[int] = None) -> None:
@@ -235,21 +303,9 @@ class GridWorld:
         if state is None:
             return
 
-        if action.type == ActionType.WAIT:
-            return
-        if action.type == ActionType.MOVE:
-            if not action.direction:
-                return
-            self._move_agent(agent_id, action.direction)
-            return
-        if action.type == ActionType.PICK_UP:
-            self._pickup_item(state, action.item)
-            return
-        if action.type == ActionType.DROP:
-            self._drop_item(state, action.item)
-            return
-        if action.type == ActionType.USE:
-            self.handle_use(state, action)
+        handler = self._action_handlers.get(action.type)
+        if handler is not None:
+            handler(state, action)
             return
 
         if not self.handle_custom_action(state, action):
@@ -278,8 +334,56 @@ class GridWorld:
         """Return supplementary information for observers."""
         return {}
 
+    def cached_tile_metadata(self, position: Tuple[int, int]) -> Dict[str, object]:
+        """
+        Return `tile_metadata(position)`, reusing the value computed since the last change.
+
+        The returned dictionary is shared between callers and must not be mutated.
+        """
+        index = position[1] * self.width + position[0]
+        metadata = self._metadata_cache.get(index)
+        if metadata is None:
+            metadata = self._metadata_cache[index] = self.tile_metadata(position)
+        return metadata
+
+    def invalidate_tile_metadata(self) -> None:
+        """
+        Drop cached tile metadata and terrain strings.
+
+        `step` calls this after every action and after `after_step`; code that changes
+        tiles or soil outside a turn should call it as well.
+        """
+        self._metadata_cache.clear()
+        self._terrain_cache.clear()
+
+    def terrain_at(self, position: Tuple[int, int]) -> str:
+        """Return the terrain string agents observe for the tile at `position`."""
+        index = position[1] * self.width + position[0]
+        terrain = self._terrain_cache.get(index)
+        if terrain is None:
+            terrain = self._terrain_cache[index] = self._get_terrain_string(
+                self._tiles[index], self.cached_tile_metadata(position)
+            )
+        return terrain
+
     # -- internal helpers -------------------------------------------------
 
+    def _handle_wait(self, state: AgentState, action: Action) -> None:
+        """Do nothing for `ActionType.WAIT`."""
+
+    def _handle_move(self, state: AgentState, action: Action) -> None:
+        """Resolve `ActionType.MOVE` when a direction was supplied."""
+        if action.direction:
+            self._move_agent(state.agent_id, action.direction)
+
+    def _handle_pick_up(self, state: AgentState, action: Action) -> None:
+        """Resolve `ActionType.PICK_UP`."""
+        self._pickup_item(state, action.item)
+
+    def _handle_drop(self, state: AgentState, action: Action) -> None:
+        """Resolve `ActionType.DROP`."""
+        self._drop_item(state, action.item)
+
     def _move_agent(self, agent_id: int, direction: Direction) -> None:
         """Move the agent in the specified direction if the target tile is walkable."""
         state = self._agents.get(agent_id)
@@ -287,18 +391,19 @@ class GridWorld:
             return
 
         dx, dy = direction.delta()
-        new_position = (state.position[0] + dx, state.position[1] + dy)
-        if not self.in_bounds(new_position):
+        x, y = state.position
+        new_x, new_y = x + dx, y + dy
+        if not (0 <= new_x < self.width and 0 <= new_y < self.height):
             return
-        target_tile = self.get_tile(new_position)
+        target_tile = self._tiles[new_y * self.width + new_x]
         if not target_tile.is_walkable():
             return
 
-        current_tile = self.get_tile(state.position)
-        if agent_id in current_tile.agents:
-            current_tile.agents.remove(agent_id)
-        target_tile.agents.append(agent_id)
-        state.position = new_position
+        current_tile = self._tiles[y * self.width + x]
+        if current_tile.occupant == agent_id:
+            current_tile.occupant = None
+        target_tile.occupant = agent_id
+        state.position = (new_x, new_y)
 
     def _pickup_item(self, state: AgentState, item_name: Optional[str]) -> None:
         """Transfer an item from the tile to the agent, if available."""
@@ -317,45 +422,35 @@ class GridWorld:
             tile = self.get_tile(state.position)
             tile.add_item(item_name)
 
-    def _build_observation(self, agent_id: int) -> Observation:
+    def _time_remaining(self) -> Optional[int]:
+        """Return the number of turns left in the episode, or `None` when unlimited."""
+        if self.max_turns is None:
+            return None
+        return max(self.max_turns - self.turn, 0)
+
+    def _build_observation(self, agent_id: int, time_remaining: Optional[int]) -> Observation:
         """
         Construct the observation bundle delivered to the agent controller.
         Only includes the current position and immediate neighbors (4-connected).
+        The turn-wide `time_remaining` is computed once by `step` for all agents.
         """
         state = self._agents[agent_id]
-        tiles: Dict[Tuple[int, int], Dict[str, str]] = {}
+        terrain: Dict[Tuple[int, int], str] = {}
         
-        # Include current position
+        # Include current position and only immediate neighbors (4-connected: up, down, left, right)
         current_pos = state.position
-        positions_to_include = [current_pos]
-        
-        # Include only immediate neighbors (4-connected: up, down, left, right)
-        for direction in Direction:
-            dx, dy = direction.delta()
-            neighbor_pos = (current_pos[0] + dx, current_pos[1] + dy)
-            if self.in_bounds(neighbor_pos):
-                positions_to_include.append(neighbor_pos)
-        
-        # Build simplified tile dict with just terrain info
-        for position in positions_to_include:
-            x, y = position
-            tile = self._grid[y][x]
-            metadata = self.tile_metadata(position)
-            
-            # Determine terrain string based on tile state
-            terrain_str = self._get_terrain_string(tile, metadata)
-            tiles[position] = {"terrain": terrain_str}
+        positions_to_include = (current_pos,) + self._neighbors[current_pos[1] * self.width + current_pos[0]]
 
-        time_remaining: Optional[int] = None
-        if self.max_turns is not None:
-            time_remaining = max(self.max_turns - self.turn, 0)
+        # Map each visible position to its terrain string
+        for position in positions_to_include:
+            terrain[position] = self.terrain_at(position)
 
         return Observation(
             turn=self.turn,
             time_remaining=time_remaining,
             position=state.position,
-            inventory=dict(state.inventory),
-            tiles=tiles,
+            inventory=state.inventory_view,
+            terrain=terrain,
             width=self.width,
             height=self.height,
         )
@@ -376,17 +471,9 @@ class GridWorld:
         soil = metadata.get("soil")
         if soil and isinstance(soil, dict):
             stage = soil.get("stage")
-            if stage == "seed":
-                return "seed"
-            elif stage == "growing":
-                return "growing"
-            elif stage == "ready":
-                return "ready"
-            elif stage == "weed":
-                return "weed"
-            elif stage == "empty":
-                return "empty"
-        
+            if stage in _SOIL_STAGE_TERRAINS:
+                return stage
+
         # Check if not farmable
         if not metadata.get("farmable", True):
             return "non-farmable"
@@ -405,14 +492,65 @@ class CropStage(str, Enum):
     WEED = "weed"
 
 
-@dataclass
+# Stage groups tested inside the per-turn crop loops.
+_IDLE_STAGES = frozenset({CropStage.EMPTY, CropStage.WEED})
+_GROWING_STAGES = frozenset({CropStage.PLANTED, CropStage.GROWING})
+
+
 class SoilPlot:
-    """Mutable state describing a single patch of soil."""
+    """
+    Mutable state describing a single patch of soil.
+
+    Plots owned by a `DroneField` report every change of `stage` to it, which keeps the
+    field's crop-update and render-change indexes in sync however the stage is written.
+    """
+
+    __slots__ = ("_stage", "growth", "hydration", "dry_turns", "_field", "_index")
 
-    stage: CropStage = CropStage.EMPTY
-    growth: int = 0
-    hydration: int = 0
-    dry_turns: int = 0
+    def __init__(
+        self,
+        stage: CropStage = CropStage.EMPTY,
+        growth: int = 0,
+        hydration: int = 0,
+        dry_turns: int = 0,
+    ) -> None:
+        self._stage = stage
+        self.growth = growth
+        self.hydration = hydration
+        self.dry_turns = dry_turns
+        self._field: Optional["DroneField"] = None
+        self._index = -1
+
+    @property
+    def stage(self) -> CropStage:
+        """Current crop stage of the plot."""
+        return self._stage
+
+    @stage.setter
+    def stage(self, value: CropStage) -> None:
+        if value is self._stage:
+            return
+        self._stage = value
+        if self._field is not None:
+            self._field._soil_stage_changed(self._index)
+
+    def __repr__(self) -> str:
+        return (
+            f"SoilPlot(stage={self._stage!r}, growth={self.growth!r}, "
+            f"hydration={self.hydration!r}, dry_turns={self.dry_turns!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SoilPlot):
+            return NotImplemented
+        return (self._stage, self.growth, self.hydration, self.dry_turns) == (
+            other._stage,
+            other.growth,
+            other.hydration,
+            other.dry_turns,
+        )
+
+    __hash__ = None  # type: ignore[assignment]
 
     def reset(self) -> None:
         """Reset the plot to an empty, dry state."""
@@ -424,7 +562,7 @@ class SoilPlot:
     @property
     def needs_water(self) -> bool:
         """Return `True` when the plot requires watering."""
-        return self.stage in {CropStage.PLANTED, CropStage.GROWING} and self.hydration <= 0
+        return self.stage in _GROWING_STAGES and self.hydration <= 0
 
     def to_metadata(self) -> Dict[str, object]:
         """Return a serialisable view of the plot for observers."""
@@ -437,6 +575,10 @@ class SoilPlot:
         }
 
 
+# Actions charged at `DroneField.action_cost`.
+_FARMING_ACTIONS = frozenset({ActionType.PLANT, ActionType.WATER, ActionType.HARVEST})
+
+
 class DroneField(GridWorld):
     """
     Drone-based farming environment combining planting, watering, and harvesting actions.
@@ -464,9 +606,16 @@ class DroneField(GridWorld):
         Create the environment and seed default resource tiles.
         """
         super().__init__(width, height, max_turns=max_turns)
-        self._soil: List[List[SoilPlot]] = [
-            [SoilPlot() for _ in range(width)] for _ in range(height)
-        ]
+        # Row-major soil plots, laid out like `GridWorld._tiles`. Each plot reports its
+        # stage changes through `_soil_stage_changed`.
+        self._soil: List[SoilPlot] = [SoilPlot() for _ in range(width * height)]
+        for index, plot in enumerate(self._soil):
+            plot._field = self
+            plot._index = index
+        # Indices of plots `_advance_crops` still has to update; any stage change adds to it.
+        self._active_soil: set[int] = set()
+        # Indices of plots whose stage changed since the last `consume_soil_changes`.
+        self._changed_soil: set[int] = set()
 
         self.growth_threshold_seedling = growth_threshold_seedling
         self.growth_threshold_mature = growth_threshold_mature
@@ -477,6 +626,13 @@ class DroneField(GridWorld):
         self.total_harvested = 0
         self.turns_since_last_seed_spawn = 0
 
+        # Bound here so subclass overrides of the crop handlers are picked up.
+        self._farming_handlers: Dict[ActionType, Callable[[AgentState, SoilPlot], bool]] = {
+            ActionType.PLANT: self._handle_plant,
+            ActionType.WATER: self._handle_water,
+            ActionType.HARVEST: self._handle_harvest,
+        }
+
         self.base_position = base_position or (width - 1, 0)
         self.battery_capacity = battery_capacity
         self.idle_cost = idle_cost
@@ -490,12 +646,11 @@ class DroneField(GridWorld):
         self.water_sources: List[Tuple[int, int]] = [(width // 2, bottom_row)]
         self.seed_supply: List[Tuple[int, int]] = [(0, bottom_row)]
 
-        self._farmable: List[List[bool]] = [
-            [True for _ in range(width)] for _ in range(height)
-        ]
+        # Row-major farmability flags, laid out like `GridWorld._tiles`.
+        self._farmable: bytearray = bytearray(b"\x01") * (width * height)
 
         for pos in self.water_sources + self.seed_supply:
-            self._farmable[pos[1]][pos[0]] = False
+            self._farmable[pos[1] * width + pos[0]] = False
 
         for position in self.water_sources:
             self.scatter_items(position, "water", self.water_source_capacity)
@@ -504,7 +659,7 @@ class DroneField(GridWorld):
 
         base_tile = self.get_tile(self.base_position)
         base_tile.terrain = "launch_pad"
-        self._farmable[self.base_position[1]][self.base_position[0]] = False
+        self._farmable[self.base_position[1] * width + self.base_position[0]] = False
 
     def register_agent(
         self,
@@ -525,7 +680,7 @@ class DroneField(GridWorld):
             return
 
         if self._battery[agent_id] <= 0:
-            super().execute_action(agent_id, Action(ActionType.WAIT))
+            super().execute_action(agent_id, WAIT_ACTION)
             return
 
         starting_battery = self._battery[agent_id]
@@ -533,9 +688,9 @@ class DroneField(GridWorld):
 
         cost = self.idle_cost
         if action is not None:
-            if action.type == ActionType.MOVE:
+            if action.type is ActionType.MOVE:
                 cost = self.move_cost
-            elif action.type in {ActionType.PLANT, ActionType.WATER, ActionType.HARVEST}:
+            elif action.type in _FARMING_ACTIONS:
                 cost = self.action_cost
 
         self._battery[agent_id] = max(starting_battery - cost, 0)
@@ -554,11 +709,12 @@ class DroneField(GridWorld):
 
     def tile_metadata(self, position: Tuple[int, int]) -> Dict[str, object]:
         """Include soil information and launch pad markers for each tile."""
-        x, y = position
-        soil = self._soil[y][x]
+        index = position[1] * self.width + position[0]
+        soil = self._soil[index]
+        farmable = self._farmable[index] == 1
         return {
-            "soil": soil.to_metadata() if self._farmable[y][x] else None,
-            "farmable": self._farmable[y][x],
+            "soil": soil.to_metadata() if farmable else None,
+            "farmable": farmable,
             "launch_pad": position == self.base_position,
         }
 
@@ -568,12 +724,7 @@ class DroneField(GridWorld):
 
     def summary(self) -> Dict[str, object]:
         """Return a concise snapshot of the simulation."""
-        weed_plots = sum(
-            1
-            for row in self._soil
-            for soil in row
-            if soil.stage is CropStage.WEED
-        )
+        weed_plots = sum(1 for soil in self._soil if soil.stage is CropStage.WEED)
         return {
             "turn": self.turn,
             "total_harvested": self.total_harvested,
@@ -583,13 +734,41 @@ class DroneField(GridWorld):
     def is_farmable(self, position: Tuple[int, int]) -> bool:
         """Return `True` when the position is a plot that can hold crops."""
         x, y = position
-        return self._farmable[y][x]
+        return self._farmable[y * self.width + x] == 1
+
+    def soil_stage(self, position: Tuple[int, int]) -> CropStage:
+        """Return the crop stage of the plot at `position` without building metadata."""
+        return self._soil[position[1] * self.width + position[0]].stage
+
+    def _soil_at(self, position: Tuple[int, int]) -> SoilPlot:
+        """
+        Return the soil plot stored for `position`.
+
+        The plot may be modified in place; assigning its `stage` is enough for crop updates
+        and renderers to pick the change up.
+        """
+        return self._soil[position[1] * self.width + position[0]]
+
+    def _soil_stage_changed(self, index: int) -> None:
+        """Schedule plot `index` for crop updates and report it to renderers."""
+        self._active_soil.add(index)
+        self._changed_soil.add(index)
+
+    def consume_soil_changes(self) -> List[Tuple[int, int]]:
+        """Return the positions whose crop stage changed since the previous call."""
+        changed = self._changed_soil
+        if not changed:
+            return []
+        width = self.width
+        positions = [(index % width, index // width) for index in changed]
+        changed.clear()
+        return positions
 
     # -- crop interactions -------------------------------------------------
 
     def _handle_plant(self, state: AgentState, soil: SoilPlot) -> bool:
         """Plant a seed if the soil is empty and the agent has seeds."""
-        if soil.stage not in {CropStage.EMPTY}:
+        if soil.stage is not CropStage.EMPTY:
             return False
         if "seed" not in state.inventory:
             return False
@@ -603,7 +782,7 @@ class DroneField(GridWorld):
 
     def _handle_water(self, state: AgentState, soil: SoilPlot) -> bool:
         """Water a planted or growing crop if water is available."""
-        if soil.stage not in {CropStage.PLANTED, CropStage.GROWING}:
+        if soil.stage not in _GROWING_STAGES:
             return False
         if "water" not in state.inventory:
             return False
@@ -627,63 +806,68 @@ class DroneField(GridWorld):
 
     def handle_custom_action(self, state: AgentState, action: Action) -> bool:  # type: ignore[override]
         """Process planting, watering, and harvesting requests."""
+        handler = self._farming_handlers.get(action.type)
+        if handler is None:
+            return False
         position = state.position
         if not self.is_farmable(position):
             return False
-        soil = self._soil[position[1]][position[0]]
-
-        if action.type == ActionType.PLANT:
-            return self._handle_plant(state, soil)
-        if action.type == ActionType.WATER:
-            return self._handle_water(state, soil)
-        if action.type == ActionType.HARVEST:
-            return self._handle_harvest(state, soil)
-        return False
+        return handler(state, self._soil_at(position))
 
     # -- lifecycle helpers ------------------------------------------------
 
     def _advance_crops(self) -> None:
         """Progress crop growth based on hydration and stage thresholds."""
-        for y, row in enumerate(self._soil):
-            for x, soil in enumerate(row):
-                if not self._farmable[y][x]:
-                    continue
-                if soil.stage in {CropStage.EMPTY, CropStage.WEED}:
-                    soil.dry_turns = 0
-                    continue
-                if soil.hydration > 0:
-                    soil.growth += 1
-                    soil.hydration -= 1
-                    soil.dry_turns = 0
-                else:
-                    soil.dry_turns += 1
-
-                if soil.stage == CropStage.PLANTED and soil.growth >= self.growth_threshold_seedling:
-                    soil.stage = CropStage.GROWING
-                    soil.growth = 0
-                    soil.dry_turns = 0
-                elif soil.stage == CropStage.GROWING and soil.growth >= self.growth_threshold_mature:
-                    soil.stage = CropStage.READY
-                    soil.growth = 0
-                    soil.dry_turns = 0
-                elif soil.stage in {CropStage.PLANTED, CropStage.GROWING} and soil.dry_turns >= 2:
-                    soil.stage = CropStage.WEED
-                    soil.growth = 0
-                    soil.hydration = 0
+        farmable = self._farmable
+        plots = self._soil
+        active = self._active_soil
+        seedling_threshold = self.growth_threshold_seedling
+        mature_threshold = self.growth_threshold_mature
+        # Plots leave the active set once idle; a fresh weed patch is visited once more
+        # so its dry-turn counter is cleared on the following turn.
+        for index in tuple(active):
+            if not farmable[index]:
+                active.discard(index)
+                continue
+            soil = plots[index]
+            stage = soil.stage
+            if stage in _IDLE_STAGES:
+                soil.dry_turns = 0
+                active.discard(index)
+                continue
+            if soil.hydration > 0:
+                soil.growth += 1
+                soil.hydration -= 1
+                soil.dry_turns = 0
+            else:
+                soil.dry_turns += 1
+
+            if stage is CropStage.PLANTED and soil.growth >= seedling_threshold:
+                soil.stage = CropStage.GROWING
+                soil.growth = 0
+                soil.dry_turns = 0
+            elif stage is CropStage.GROWING and soil.growth >= mature_threshold:
+                soil.stage = CropStage.READY
+                soil.growth = 0
+                soil.dry_turns = 0
+            elif stage in _GROWING_STAGES and soil.dry_turns >= 2:
+                soil.stage = CropStage.WEED
+                soil.growth = 0
+                soil.hydration = 0
 
     def _replenish_resources(self) -> None:
         """Top up resource tiles with water and seeds."""
+        capacity = self.water_source_capacity
         for position in self.water_sources:
-            tile = self.get_tile(position)
-            current = tile.items.get("water", 0)
-            if current < self.water_source_capacity:
-                tile.add_item("water", self.water_source_capacity - current)
+            items = self.get_tile(position).items
+            if items.get("water", 0) < capacity:
+                items["water"] = capacity
 
         self.turns_since_last_seed_spawn += 1
         if self.turns_since_last_seed_spawn >= 3:
-            for position in self.seed_supply:
-                tile = self.get_tile(position)
-                tile.add_item("seed", self.seed_spawn_rate)
+            if self.seed_spawn_rate:
+                for position in self.seed_supply:
+                    self.get_tile(position).add_item("seed", self.seed_spawn_rate)
             self.turns_since_last_seed_spawn = 0
 
 
@@ -716,7 +900,8 @@ class DronePlantingField(DroneField):
         self.growing_turns = max(1, growing_turns)
         self.grown_plots: set[tuple[int, int]] = set()
         obstacle_positions = set(obstacles or self._default_obstacles(width, height))
-        self._planting_obstacles: Dict[Tuple[int, int], bool] = {}
+        self._planting_obstacles: List[Tuple[int, int]] = []
+        self._planting_obstacle_mask: bytearray = bytearray(width * height)
         self._place_obstacles(obstacle_positions)
 
     def _handle_plant(self, state: AgentState, soil: SoilPlot) -> bool:  # type: ignore[override]
@@ -744,40 +929,44 @@ class DronePlantingField(DroneField):
 
     def _advance_crops(self) -> None:  # type: ignore[override]
         """Progress planted crops to the grown stage without hydration requirements."""
-        for y, row in enumerate(self._soil):
-            for x, soil in enumerate(row):
-                if not self._farmable[y][x]:
-                    continue
-                position = (x, y)
-                if soil.stage is CropStage.EMPTY:
-                    continue
-                if soil.stage is CropStage.WEED:
-                    continue
-                if soil.stage is CropStage.PLANTED:
-                    soil.growth = min(soil.growth + 1, self.seed_turns)
-                    if soil.growth >= self.seed_turns:
-                        soil.stage = CropStage.GROWING
-                        soil.growth = 0
-                elif soil.stage is CropStage.GROWING:
-                    soil.growth = min(soil.growth + 1, self.growing_turns)
-                    if soil.growth >= self.growing_turns:
-                        soil.stage = CropStage.READY
-                        soil.growth = 0
-                        self.grown_plots.add(position)
-                elif soil.stage is CropStage.READY:
-                    self.grown_plots.add(position)
+        farmable = self._farmable
+        plots = self._soil
+        active = self._active_soil
+        width = self.width
+        seed_turns = self.seed_turns
+        growing_turns = self.growing_turns
+        grown_plots = self.grown_plots
+        for index in tuple(active):
+            soil = plots[index]
+            stage = soil.stage
+            if not farmable[index] or stage is CropStage.EMPTY or stage is CropStage.WEED:
+                active.discard(index)
+                continue
+            if stage is CropStage.PLANTED:
+                soil.growth = min(soil.growth + 1, seed_turns)
+                if soil.growth >= seed_turns:
+                    soil.stage = CropStage.GROWING
+                    soil.growth = 0
+            elif stage is CropStage.GROWING:
+                soil.growth = min(soil.growth + 1, growing_turns)
+                if soil.growth >= growing_turns:
+                    soil.stage = CropStage.READY
+                    soil.growth = 0
+                    y, x = divmod(index, width)
+                    grown_plots.add((x, y))
+            elif stage is CropStage.READY:
+                # Grown crops never change again in this challenge.
+                y, x = divmod(index, width)
+                grown_plots.add((x, y))
+                active.discard(index)
 
     def tile_metadata(self, position: Tuple[int, int]) -> Dict[str, object]:  # type: ignore[override]
         """Expose planting challenge metadata for HUDs and agents."""
         metadata = super().tile_metadata(position)
-        soil_meta = metadata.get("soil")
-        metadata.update(
-            {
-                "grown_crop": position in self.grown_plots,
-                "weed": bool(soil_meta and soil_meta.get("stage") == CropStage.WEED.value),
-                "obstacle": position in self._planting_obstacles,
-            }
-        )
+        index = position[1] * self.width + position[0]
+        metadata["grown_crop"] = position in self.grown_plots
+        metadata["weed"] = metadata["farmable"] and self._soil[index].stage is CropStage.WEED
+        metadata["obstacle"] = self._planting_obstacle_mask[index] == 1
         return metadata
 
     def summary(self) -> Dict[str, object]:  # type: ignore[override]
@@ -810,14 +999,11 @@ class DronePlantingField(DroneField):
     @staticmethod
     def _default_obstacles(width: int, height: int) -> set[Tuple[int, int]]:
         """Generate a few static tree obstacles for the planting field."""
-        obstacles: set[Tuple[int, int]] = set()
         if width < 4 or height < 4:
-            return obstacles
+            return set()
         mid_y = max(1, height // 2)
-        for x in range(1, width, 3):
-            obstacles.add((x, mid_y))
-        for y in range(2, height, 4):
-            obstacles.add((width // 2, y))
+        obstacles = {(x, mid_y) for x in range(1, width, 3)}
+        obstacles.update((width // 2, y) for y in range(2, height, 4))
         return obstacles
 
     def _place_obstacles(self, obstacles: Iterable[Tuple[int, int]]) -> None:
@@ -827,16 +1013,19 @@ class DronePlantingField(DroneField):
                 continue
             if position == self.base_position:
                 continue
-            tile = self.get_tile(position)
+            index = position[1] * self.width + position[0]
+            tile = self._tiles[index]
             tile.blocking = True
             tile.terrain = "tree"
-            self._farmable[position[1]][position[0]] = False
-            self._soil[position[1]][position[0]].reset()
-            self._planting_obstacles[position] = True
+            self._farmable[index] = False
+            self._soil[index].reset()
+            if not self._planting_obstacle_mask[index]:
+                self._planting_obstacle_mask[index] = True
+                self._planting_obstacles.append(position)
 
     def planting_obstacles(self) -> List[Tuple[int, int]]:
         """Return the list of obstacle coordinates."""
-        return list(self._planting_obstacles.keys())
+        return list(self._planting_obstacles)
 
 
 class DroneNavigationField(DroneField):
@@ -902,7 +1091,8 @@ class DroneNavigationField(DroneField):
         self.goal_turn: Optional[int] = None
         self.goal_agent_id: Optional[int] = None
 
-        self._obstacles: Dict[Tuple[int, int], bool] = {}
+        self._obstacles: List[Tuple[int, int]] = []
+        self._obstacle_mask: bytearray = bytearray(grid_width * grid_height)
         self._prepare_field(resolved_obstacles)
 
     @staticmethod
@@ -937,18 +1127,13 @@ class DroneNavigationField(DroneField):
     @staticmethod
     def _default_obstacle_field(width: int, height: int) -> set[Tuple[int, int]]:
         """Generate a deterministic obstacle pattern with deliberate gaps."""
-        obstacles: set[Tuple[int, int]] = set()
         if width < 4 or height < 4:
-            return obstacles
+            return set()
 
         mid_x = width // 2
-        for y in range(1, height - 1):
-            if y % 2 == 0:
-                continue
-            obstacles.add((mid_x, y))
-
-        for x in range(1, width - 1, 3):
-            obstacles.add((x, height // 2))
+        # Odd rows of the middle column, then every third column of the middle row.
+        obstacles = {(mid_x, y) for y in range(1, height - 1, 2)}
+        obstacles.update((x, height // 2) for x in range(1, width - 1, 3))
 
         gap = (mid_x, height - 2)
         obstacles.discard(gap)
@@ -964,57 +1149,63 @@ class DroneNavigationField(DroneField):
         self.seed_supply = []
         self.turns_since_last_seed_spawn = 0
 
+        width, height = self.width, self.height
+        tiles = self._tiles
+        farmable = self._farmable
+        obstacle_mask = self._obstacle_mask
+        cell_count = width * height
+
         self._obstacles.clear()
-        for y in range(self.height):
-            for x in range(self.width):
-                tile = self.get_tile((x, y))
-                tile.blocking = False
-                tile.terrain = "plain"
-                self._farmable[y][x] = True
+        obstacle_mask[:] = bytes(cell_count)
+        farmable[:] = b"\x01" * cell_count
+        for tile in tiles:
+            tile.blocking = False
+            tile.terrain = "plain"
 
         base_tile = self.get_tile(self.start_position)
         base_tile.terrain = "launch_pad"
-        self._farmable[self.start_position[1]][self.start_position[0]] = False
+        farmable[self.start_position[1] * width + self.start_position[0]] = False
 
         for position in obstacles:
-            if not self.in_bounds(position):
+            x, y = position
+            if not (0 <= x < width and 0 <= y < height):
                 continue
             if position == self.start_position or position == self.goal_position:
                 continue
-            tile = self.get_tile(position)
+            index = y * width + x
+            if obstacle_mask[index]:
+                continue
+            tile = tiles[index]
             tile.blocking = True
             tile.terrain = "tree"
-            self._farmable[position[1]][position[0]] = False
-            self._soil[position[1]][position[0]].reset()
-            self._obstacles[position] = True
+            farmable[index] = False
+            self._soil[index].reset()
+            obstacle_mask[index] = True
+            self._obstacles.append(position)
 
         goal_tile = self.get_tile(self.goal_position)
         goal_tile.terrain = "goal"
         goal_tile.blocking = False
-        self._farmable[self.goal_position[1]][self.goal_position[0]] = True
+        self._farmable[self.goal_position[1] * self.width + self.goal_position[0]] = True
 
     def after_step(self) -> None:  # type: ignore[override]
         """Override to monitor goal completion while retaining base updates."""
         super().after_step()
         if self.goal_reached:
             return
-        for agent_id, state in self.agent_states.items():
-            if state.position == self.goal_position:
-                self.goal_reached = True
-                self.goal_turn = self.turn + 1
-                self.goal_agent_id = agent_id
-                break
+        # Tiles hold at most one agent, so the goal's occupant is the only candidate.
+        agent_id = self.get_tile(self.goal_position).occupant
+        if agent_id is not None:
+            self.goal_reached = True
+            self.goal_turn = self.turn + 1
+            self.goal_agent_id = agent_id
 
     def tile_metadata(self, position: Tuple[int, int]) -> Dict[str, object]:  # type: ignore[override]
         """Expose obstacle and goal markers in addition to base metadata."""
         metadata = super().tile_metadata(position)
-        metadata.update(
-            {
-                "obstacle": position in self._obstacles,
-                "goal": position == self.goal_position,
-                "start": position == self.start_position,
-            }
-        )
+        metadata["obstacle"] = self._obstacle_mask[position[1] * self.width + position[0]] == 1
+        metadata["goal"] = position == self.goal_position
+        metadata["start"] = position == self.start_position
         return metadata
 
     def summary(self) -> Dict[str, object]:  # type: ignore[override]
@@ -1031,4 +1222,4 @@ class DroneNavigationField(DroneField):
 
     def obstacles(self) -> List[Tuple[int, int]]:
         """Return a copy of the obstacle list for external use."""
-        return list(self._obstacles.keys())
+        return list(self._obstacles)
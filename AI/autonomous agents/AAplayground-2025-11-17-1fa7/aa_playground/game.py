@@ -9,15 +9,24 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import pygame
 
 from .agents import BaseAgent, KeyboardDroneAgent
-from .core import Action, ActionType, Direction
+from .core import WAIT_ACTION, Action, ActionType, Direction
 from .environment import AgentState, CropStage, DroneField
 from .sprites import CropSprites, DroneSprites, TreeSprites
 
+# Fill colours for farmable tiles keyed by the soil stage reported in tile metadata.
+_STAGE_COLORS = {
+    "empty": (120, 85, 60),
+    "seed": (110, 150, 80),
+    "growing": (70, 160, 75),
+    "ready": (200, 170, 40),
+    "weed": (85, 130, 55),
+}
+
 
 @dataclass(frozen=True)
 class DroneGameConfig:
@@ -29,6 +38,33 @@ class DroneGameConfig:
     turn_interval: float = 0.4
 
 
+# Keyboard bindings for `KeyboardDroneAgent`; actions are immutable and shared.
+_KEY_ACTIONS = {
+    pygame.K_UP: Action(ActionType.MOVE, direction=Direction.UP),
+    pygame.K_DOWN: Action(ActionType.MOVE, direction=Direction.DOWN),
+    pygame.K_LEFT: Action(ActionType.MOVE, direction=Direction.LEFT),
+    pygame.K_RIGHT: Action(ActionType.MOVE, direction=Direction.RIGHT),
+    pygame.K_p: Action(ActionType.PLANT),
+    pygame.K_w: Action(ActionType.WATER),
+    pygame.K_h: Action(ActionType.HARVEST),
+    pygame.K_SPACE: Action(ActionType.HARVEST),
+    pygame.K_g: Action(ActionType.PICK_UP),
+    pygame.K_PERIOD: WAIT_ACTION,
+    pygame.K_s: WAIT_ACTION,
+}
+
+# Number of rendered HUD text surfaces kept before the oldest is dropped.
+_TEXT_CACHE_SIZE = 128
+
+# Event types consumed by `DroneGameSession._handle_events`.
+_HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN)
+
+# Crop stages that have a sprite, keyed by the stage name reported in tile metadata.
+_SPRITE_STAGE_BY_NAME = {
+    stage.value: stage for stage in CropStage if stage is not CropStage.EMPTY
+}
+
+
 class DroneGameSession:
     """Orchestrates the pygame window, input handling, and simulation updates."""
 
@@ -49,6 +85,9 @@ class DroneGameSession:
         pygame.display.set_caption("Drone Field - Turn Based Playground")
 
         self.clock = pygame.time.Clock()
+        # Only quit and key presses are handled; keep other event types out of the queue.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_HANDLED_EVENTS)
         self.font_small = pygame.font.SysFont("arial", 18)
         self.font_large = pygame.font.SysFont("arial", 24, bold=True)
 
@@ -64,6 +103,25 @@ class DroneGameSession:
         self._drone_sprites = DroneSprites(self.config.tile_size)
         self._tree_sprites = TreeSprites(self.config.tile_size)
         self._crop_sprites = CropSprites(self.config.tile_size)
+        self._text_cache: Dict[
+            Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface
+        ] = {}
+        self._tile_surfaces: Dict[Tuple[Tuple[int, int, int], bool, bool], pygame.Surface] = {}
+        # Grid-sized copy of the static tile layer, repainted per tile when a turn changes it.
+        self._background = pygame.Surface((width, environment.height * config.tile_size)).convert()
+        self._background_keys: List[Optional[Tuple[Tuple[int, int, int], bool, bool]]] = [
+            None
+        ] * (environment.width * environment.height)
+        self._background_turn: Optional[int] = None
+        tile_size = config.tile_size
+        self._tile_rects = [
+            pygame.Rect(x * tile_size, y * tile_size, tile_size, tile_size)
+            for y in range(environment.height)
+            for x in range(environment.width)
+        ]
+        self._animated_tiles: List[
+            Tuple[Tuple[int, int], pygame.Rect, Optional[CropStage], bool]
+        ] = []
 
     @staticmethod
     def _format_quantity(value: object) -> str:
@@ -79,7 +137,7 @@ class DroneGameSession:
 
     def _handle_events(self) -> None:
         """Process pygame events, converting key presses into queued actions."""
-        for event in pygame.event.get():
+        for event in pygame.event.get(_HANDLED_EVENTS):
             if event.type == pygame.QUIT:
                 self._running = False
             elif event.type == pygame.KEYDOWN:
@@ -93,25 +151,7 @@ class DroneGameSession:
 
     def _map_key_to_action(self, key: int) -> Optional[Action]:
         """Map key presses to agent actions for the keyboard-controlled player."""
-        if key == pygame.K_UP:
-            return Action(ActionType.MOVE, direction=Direction.UP)
-        if key == pygame.K_DOWN:
-            return Action(ActionType.MOVE, direction=Direction.DOWN)
-        if key == pygame.K_LEFT:
-            return Action(ActionType.MOVE, direction=Direction.LEFT)
-        if key == pygame.K_RIGHT:
-            return Action(ActionType.MOVE, direction=Direction.RIGHT)
-        if key == pygame.K_p:
-            return Action(ActionType.PLANT)
-        if key == pygame.K_w:
-            return Action(ActionType.WATER)
-        if key == pygame.K_h or key == pygame.K_SPACE:
-            return Action(ActionType.HARVEST)
-        if key == pygame.K_g:
-            return Action(ActionType.PICK_UP)
-        if key == pygame.K_PERIOD or key == pygame.K_s:
-            return Action(ActionType.WAIT)
-        return None
+        return _KEY_ACTIONS.get(key)
 
     def _update_animation(self, delta_seconds: float) -> None:
         """Advance the animation timeline for rotor rotation and bobbing."""
@@ -142,14 +182,62 @@ class DroneGameSession:
 
         self.environment.step()
 
-    def _draw_grid(self) -> None:
-        """Render the world grid, including soil states, launch pad, and obstacles."""
+    def _render_text(
+        self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]
+    ) -> pygame.Surface:
+        """Return a rendered text surface, reusing it while the same text is on screen."""
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= _TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+            surface = self._text_cache[key] = font.render(text, True, color).convert_alpha()
+        return surface
+
+    def _tile_surface(
+        self, color: Tuple[int, int, int], has_seed: bool, has_water: bool
+    ) -> pygame.Surface:
+        """Return the pre-rendered tile background for a fill colour and resource markers."""
+        key = (color, has_seed, has_water)
+        surface = self._tile_surfaces.get(key)
+        if surface is not None:
+            return surface
+
         tile_size = self.config.tile_size
-        for y in range(self.environment.height):
-            for x in range(self.environment.width):
+        surface = pygame.Surface((tile_size, tile_size)).convert()
+        tile_rect = surface.get_rect()
+        surface.fill(color)
+        pygame.draw.rect(surface, (30, 30, 30), tile_rect, width=1)
+        offset = 6
+        if has_seed:
+            seed_rect = pygame.Rect(tile_rect.left + offset, tile_rect.top + offset, 12, 12)
+            pygame.draw.rect(surface, (230, 230, 230), seed_rect)
+        if has_water:
+            water_rect = pygame.Rect(tile_rect.right - offset - 12, tile_rect.top + offset, 12, 12)
+            pygame.draw.rect(surface, (60, 140, 200), water_rect)
+        self._tile_surfaces[key] = surface
+        return surface
+
+    def _refresh_background(self) -> None:
+        """
+        Repaint background tiles whose appearance changed since the last turn.
+
+        The grid only changes when the environment steps, so the comparison runs once
+        per turn; animated crop and tree sprites are collected for `_draw_grid`.
+        """
+        environment = self.environment
+        if environment.turn == self._background_turn:
+            return
+        self._background_turn = environment.turn
+
+        tile_rects = self._tile_rects
+        animated = []
+        for y in range(environment.height):
+            for x in range(environment.width):
                 position = (x, y)
-                tile_rect = pygame.Rect(x * tile_size, y * tile_size, tile_size, tile_size)
-                metadata = self.environment.tile_metadata(position)
+                index = y * environment.width + x
+                tile_rect = tile_rects[index]
+                metadata = environment.cached_tile_metadata(position)
                 soil = metadata.get("soil")
                 launch_pad = metadata.get("launch_pad", False)
                 farmable = metadata.get("farmable", False)
@@ -166,46 +254,29 @@ class DroneGameSession:
                 elif not farmable:
                     color = (44, 82, 52)
                 elif soil:
-                    stage = soil.get("stage")
-                    if stage == "empty":
-                        color = (120, 85, 60)
-                    elif stage == "seed":
-                        color = (110, 150, 80)
-                    elif stage == "growing":
-                        color = (70, 160, 75)
-                    elif stage == "ready":
-                        color = (200, 170, 40)
-                    elif stage == "weed":
-                        color = (85, 130, 55)
-                    else:
-                        color = (90, 90, 90)
-                pygame.draw.rect(self.surface, color, tile_rect)
-                pygame.draw.rect(self.surface, (30, 30, 30), tile_rect, width=1)
-
-                tile = self.environment.get_tile(position)
-                offset = 6
-                if tile.items.get("seed"):
-                    seed_rect = pygame.Rect(
-                        tile_rect.left + offset, tile_rect.top + offset, 12, 12
-                    )
-                    pygame.draw.rect(self.surface, (230, 230, 230), seed_rect)
-                if tile.items.get("water"):
-                    water_rect = pygame.Rect(
-                        tile_rect.right - offset - 12, tile_rect.top + offset, 12, 12
-                    )
-                    pygame.draw.rect(self.surface, (60, 140, 200), water_rect)
-
-                if soil:
-                    stage_name = soil.get("stage")
-                    try:
-                        crop_stage = CropStage(stage_name) if stage_name else None
-                    except ValueError:
-                        crop_stage = None
-                    if crop_stage in {CropStage.PLANTED, CropStage.GROWING, CropStage.READY, CropStage.WEED}:
-                        self._crop_sprites.draw(self.surface, tile_rect, crop_stage, self._animation_time)
+                    color = _STAGE_COLORS.get(soil.get("stage"), (90, 90, 90))
+                items = environment.get_tile(position).items
+                key = (color, bool(items.get("seed")), bool(items.get("water")))
+                if self._background_keys[index] != key:
+                    self._background_keys[index] = key
+                    self._background.blit(self._tile_surface(*key), tile_rect)
+
+                crop_stage = _SPRITE_STAGE_BY_NAME.get(soil.get("stage")) if soil else None
+                if crop_stage is not None or obstacle:
+                    animated.append((position, tile_rect, crop_stage, obstacle))
+        self._animated_tiles = animated
 
-                if obstacle:
-                    self._tree_sprites.draw(self.surface, tile_rect, position, self._animation_time)
+    def _draw_grid(self) -> None:
+        """Render the world grid, including soil states, launch pad, and obstacles."""
+        self._refresh_background()
+        self.surface.blit(self._background, (0, 0))
+
+        animation_time = self._animation_time
+        for position, tile_rect, crop_stage, obstacle in self._animated_tiles:
+            if crop_stage is not None:
+                self._crop_sprites.draw(self.surface, tile_rect, crop_stage, animation_time)
+            if obstacle:
+                self._tree_sprites.draw(self.surface, tile_rect, position, animation_time)
 
         for state in self.environment.agent_states.values():
             self._draw_drone(state)
@@ -246,7 +317,7 @@ class DroneGameSession:
 
         line_y = hud_top + 10
         for line in lines:
-            text_surface = self.font_small.render(line, True, (220, 220, 220))
+            text_surface = self._render_text(self.font_small, line, (220, 220, 220))
             self.surface.blit(text_surface, (14, line_y))
             line_y += 24
 
@@ -266,7 +337,7 @@ class DroneGameSession:
                 f"{state.name} (id {agent_id}) – battery {battery_text}/{capacity_text} "
                 f"– inventory [{inventory_text}]"
             )
-            text_surface = self.font_large.render(text, True, (230, 230, 100))
+            text_surface = self._render_text(self.font_large, text, (230, 230, 100))
             self.surface.blit(text_surface, (14, stats_y))
             stats_y += 32
 
@@ -285,8 +356,10 @@ class DroneGameSession:
             self._handle_events()
             self._update_animation(delta_seconds)
             self._step_environment(delta_seconds)
-            self._draw()
-            pygame.display.flip()
+            # Sprites animate every frame, so only a minimised window can skip drawing.
+            if pygame.display.get_active():
+                self._draw()
+                pygame.display.flip()
 
         pygame.quit()
 
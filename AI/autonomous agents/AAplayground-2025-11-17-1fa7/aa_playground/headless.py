@@ -8,11 +8,63 @@ Description: Headless (ASCII-based) game runner for autonomous agents.
 from __future__ import annotations
 
 import math
+import sys
 import time
-from typing import Optional
+import weakref
+from typing import List, Optional, Tuple
 
 from .agents import BaseAgent
-from .environment import DronePlantingField
+from .environment import CropStage, DroneField, DronePlantingField
+
+# Glyph bytes for soil stages; empty soil keeps the template's ".".
+_STAGE_GLYPHS = {
+    CropStage.PLANTED: ord("s"),
+    CropStage.GROWING: ord("g"),
+    CropStage.READY: ord("F"),
+    CropStage.WEED: ord("w"),
+}
+
+# Per-environment frame template: the ASCII grid with newlines and the glyphs of tiles
+# that never change during an episode (launch pad, obstacles, non-farmable ground),
+# plus the buffer offset and position of every soil tile drawn from its stage.
+_SoilCells = List[Tuple[int, Tuple[int, int]]]
+_FRAME_TEMPLATES: "weakref.WeakKeyDictionary[DroneField, Tuple[bytes, _SoilCells]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Most recent frame rendered for each environment: the live buffer, the offset of the
+# drone glyph in it (or None) and the decoded text. Later renders patch the buffer.
+_LAST_FRAMES: "weakref.WeakKeyDictionary[DroneField, List[object]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _frame_template(environment: DroneField) -> Tuple[bytes, _SoilCells]:
+    """Return the cached frame template and soil cells for the environment."""
+    template = _FRAME_TEMPLATES.get(environment)
+    if template is None:
+        stride = environment.width + 1
+        buffer = bytearray(b"." * environment.width + b"\n") * environment.height
+        soil_cells: _SoilCells = []
+        for y in range(environment.height):
+            for x in range(environment.width):
+                offset = y * stride + x
+                metadata = environment.tile_metadata((x, y))
+                if metadata.get("launch_pad"):
+                    buffer[offset] = ord("B")
+                elif metadata.get("obstacle"):
+                    buffer[offset] = ord("T")
+                elif not metadata.get("farmable", True):
+                    buffer[offset] = ord("#")
+                else:
+                    soil_cells.append((offset, (x, y)))
+        template = _FRAME_TEMPLATES[environment] = (bytes(buffer[:-1]), soil_cells)
+    return template
+
+
+def _format_count(value: object) -> str:
+    """Format an inventory count or battery level, showing infinity as ∞."""
+    return "∞" if value == math.inf else str(value)
 
 
 def render_ascii(
@@ -43,38 +95,44 @@ def render_ascii(
     if agent_id is not None and agent_id in environment.agent_states:
         agent_position = environment.agent_states[agent_id].position
 
-    rows: list[str] = []
-    for y in range(environment.height):
-        cells: list[str] = []
-        for x in range(environment.width):
-            position = (x, y)
-            if agent_position == position:
-                cells.append("D")
-                continue
-            metadata = environment.tile_metadata(position)
-            soil_info: dict | None = metadata.get("soil")
-            if metadata.get("launch_pad"):
-                cells.append("B")
-            elif metadata.get("obstacle"):
-                cells.append("T")
-            elif not metadata.get("farmable", True):
-                cells.append("#")
-            elif soil_info:
-                stage = soil_info.get("stage")
-                if stage == "seed":
-                    cells.append("s")
-                elif stage == "growing":
-                    cells.append("g")
-                elif stage == "ready":
-                    cells.append("F")
-                elif stage == "weed":
-                    cells.append("w")
-                else:
-                    cells.append(".")
-            else:
-                cells.append(".")
-        rows.append("".join(cells))
-    return "\n".join(rows)
+    stride = environment.width + 1
+    drone_offset: Optional[int] = None
+    if agent_position is not None:
+        x, y = agent_position
+        drone_offset = y * stride + x
+
+    template, soil_cells = _frame_template(environment)
+    changes = environment.consume_soil_changes()
+    previous = _LAST_FRAMES.get(environment)
+    if previous is None:
+        frame = bytearray(template)
+        for offset, position in soil_cells:
+            glyph = _STAGE_GLYPHS.get(environment.soil_stage(position))
+            if glyph is not None:
+                frame[offset] = glyph
+        if drone_offset is not None:
+            frame[drone_offset] = ord("D")
+        text = frame.decode("ascii")
+        _LAST_FRAMES[environment] = [frame, drone_offset, text]
+        return text
+
+    # Only the cells whose stage changed and the old and new drone cells can differ.
+    frame, previous_offset, text = previous
+    if not changes and previous_offset == drone_offset:
+        return text
+    for x, y in changes:
+        offset = y * stride + x
+        frame[offset] = _STAGE_GLYPHS.get(environment.soil_stage((x, y)), template[offset])
+    if previous_offset is not None:
+        y, x = divmod(previous_offset, stride)
+        frame[previous_offset] = _STAGE_GLYPHS.get(
+            environment.soil_stage((x, y)), template[previous_offset]
+        )
+    if drone_offset is not None:
+        frame[drone_offset] = ord("D")
+    text = frame.decode("ascii")
+    previous[1:] = (drone_offset, text)
+    return text
 
 
 def run_headless(
@@ -92,9 +150,8 @@ def run_headless(
         agent_id: The ID of the agent in the environment.
         delay: Additional pause between turns (in seconds).
     """
-    print("Initial field:")
-    print(render_ascii(environment, agent_id))
-    print()
+    write = sys.stdout.write
+    write(f"Initial field:\n{render_ascii(environment, agent_id)}\n\n")
 
     while True:
         if environment.max_turns is not None and environment.turn >= environment.max_turns:
@@ -105,27 +162,15 @@ def run_headless(
         state = environment.agent_states[agent_id]
         grown = len(environment.grown_plots)
         
-        # Format seeds count (handle infinity)
-        seeds_value = state.inventory.get("seed", 0)
-        seeds_text = (
-            "∞" if isinstance(seeds_value, (int, float)) and math.isinf(seeds_value) 
-            else str(seeds_value)
-        )
-        
-        # Format battery level (handle infinity)
-        battery_value = environment.battery_level(agent_id)
-        battery_text = (
-            "∞"
-            if isinstance(battery_value, (int, float)) and math.isinf(battery_value)
-            else str(battery_value)
-        )
+        seeds_text = _format_count(state.inventory.get("seed", 0))
+        battery_text = _format_count(environment.battery_level(agent_id))
         
-        print(
+        # One write per turn: status line, grid, and the blank separator line.
+        write(
             f"Turn {environment.turn}: position={state.position}, seeds={seeds_text}, "
-            f"battery={battery_text}, grown_plots={grown}"
+            f"battery={battery_text}, grown_plots={grown}\n"
+            f"{render_ascii(environment, agent_id)}\n\n"
         )
-        print(render_ascii(environment, agent_id))
-        print()
 
         if environment.max_turns is not None and environment.turn >= environment.max_turns:
             break
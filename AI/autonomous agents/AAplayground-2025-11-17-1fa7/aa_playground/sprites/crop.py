@@ -8,12 +8,15 @@ Description: Procedural crop sprite surfaces and animation helpers for soil grow
 from __future__ import annotations
 
 import math
-from typing import Dict
+from typing import Dict, Tuple
 
 import pygame
 
 from ..environment import CropStage
 
+# Pulsing crops are scaled in steps of 1/_SCALE_STEPS so the scaled sprites can be cached.
+_SCALE_STEPS = 100
+
 
 class CropSprites:
     """Build and animate crop visuals for planted, growing, and ready stages."""
@@ -21,6 +24,8 @@ class CropSprites:
     def __init__(self, tile_size: int) -> None:
         self.tile_size = tile_size
         self._cache: Dict[CropStage, pygame.Surface] = {}
+        self._scaled_cache: Dict[Tuple[CropStage, int], pygame.Surface] = {}
+        self._glow_cache: Dict[int, pygame.Surface] = {}
         self._stem_color = (60, 140, 70)
         self._leaf_color = (95, 180, 105)
         self._fruit_color = (230, 210, 70)
@@ -146,6 +151,28 @@ class CropSprites:
         self._cache[CropStage.READY] = ready
         self._cache[CropStage.WEED] = weed
 
+        # Match the display's pixel format once a window exists so blits skip conversion.
+        if pygame.display.get_surface() is not None:
+            for stage, sprite in self._cache.items():
+                self._cache[stage] = sprite.convert_alpha()
+
+    def _glow_surface(self, alpha: int) -> pygame.Surface:
+        """Return the ready-crop glow disc for an alpha value, drawing it once."""
+        glow_surface = self._glow_cache.get(alpha)
+        if glow_surface is None:
+            glow_radius = max(10, int(self.tile_size * 0.32))
+            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(
+                glow_surface,
+                (255, 220, 120, alpha),
+                (glow_radius, glow_radius),
+                glow_radius,
+            )
+            if pygame.display.get_surface() is not None:
+                glow_surface = glow_surface.convert_alpha()
+            self._glow_cache[alpha] = glow_surface
+        return glow_surface
+
     def draw(
         self,
         surface: pygame.Surface,
@@ -161,37 +188,37 @@ class CropSprites:
         draw_rect = sprite.get_rect(midbottom=(tile_rect.centerx, tile_rect.bottom - 4))
         offset_x = 0.0
         scale = 1.0
+        sin = math.sin
 
         if stage is CropStage.PLANTED:
-            sway = math.sin(animation_time * 2.4 + tile_rect.left * 0.1) * 2.0
+            sway = sin(animation_time * 2.4 + tile_rect.left * 0.1) * 2.0
             offset_x = sway
         elif stage is CropStage.GROWING:
-            sway = math.sin(animation_time * 1.8 + tile_rect.top * 0.08) * 3.0
-            pulsate = 1.0 + 0.06 * math.sin(animation_time * 2.2 + tile_rect.left * 0.05)
+            sway = sin(animation_time * 1.8 + tile_rect.top * 0.08) * 3.0
+            pulsate = 1.0 + 0.06 * sin(animation_time * 2.2 + tile_rect.left * 0.05)
             offset_x = sway
             scale = pulsate
         elif stage is CropStage.READY:
-            glow_alpha = int(70 + 40 * math.sin(animation_time * 1.6 + tile_rect.left * 0.12))
-            glow_radius = max(10, int(self.tile_size * 0.32))
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(
-                glow_surface,
-                (255, 220, 120, max(40, min(120, glow_alpha))),
-                (glow_radius, glow_radius),
-                glow_radius,
-            )
+            glow_alpha = int(70 + 40 * sin(animation_time * 1.6 + tile_rect.left * 0.12))
+            glow_surface = self._glow_surface(max(40, min(120, glow_alpha)))
             glow_center = (tile_rect.centerx, tile_rect.bottom - int(self.tile_size * 0.28))
             surface.blit(glow_surface, glow_surface.get_rect(center=glow_center))
-            sway = math.sin(animation_time * 1.4 + tile_rect.left * 0.06) * 1.5
+            sway = sin(animation_time * 1.4 + tile_rect.left * 0.06) * 1.5
             offset_x = sway
         elif stage is CropStage.WEED:
-            sway = math.sin(animation_time * 2.8 + tile_rect.left * 0.18) * 2.5
+            sway = sin(animation_time * 2.8 + tile_rect.left * 0.18) * 2.5
             offset_x = sway
-            rustle = 1.0 + 0.04 * math.sin(animation_time * 3.0 + tile_rect.top * 0.22)
+            rustle = 1.0 + 0.04 * sin(animation_time * 3.0 + tile_rect.top * 0.22)
             scale = rustle
 
-        if scale != 1.0:
-            scaled = pygame.transform.rotozoom(sprite, 0, scale)
+        scale_step = round(scale * _SCALE_STEPS)
+        if scale_step != _SCALE_STEPS:
+            scaled = self._scaled_cache.get((stage, scale_step))
+            if scaled is None:
+                scaled = pygame.transform.rotozoom(sprite, 0, scale_step / _SCALE_STEPS)
+                if pygame.display.get_surface() is not None:
+                    scaled = scaled.convert_alpha()
+                self._scaled_cache[(stage, scale_step)] = scaled
             scaled_rect = scaled.get_rect(midbottom=(draw_rect.centerx + offset_x, draw_rect.bottom))
             surface.blit(scaled, scaled_rect)
         else:
@@ -8,20 +8,41 @@ Description: Drone sprite creation and rendering helpers.
 from __future__ import annotations
 
 import math
-from typing import Tuple
+from typing import Dict, List, Tuple
 
 import pygame
 
 from ..environment import AgentState
 
+# Angular resolution of the pre-rotated rotor blade frames, in degrees. It must divide
+# the 45 degree blade spacing so every blade lands exactly on a frame.
+_ROTOR_FRAME_STEP = 9
+_ROTOR_FRAME_COUNT = 360 // _ROTOR_FRAME_STEP
+# Frame offsets of the four blades, which are set 45 degrees apart.
+_BLADE_FRAME_OFFSETS = tuple(index * (45 // _ROTOR_FRAME_STEP) for index in range(4))
+
 
 class DroneSprites:
     """Build and render the animated drone sprites."""
 
     def __init__(self, tile_size: int) -> None:
         self.tile_size = tile_size
+        # Copies of the shadow and glow surfaces keyed by their whole-surface alpha.
+        self._shadow_variants: Dict[int, pygame.Surface] = {}
+        self._glow_variants: Dict[int, pygame.Surface] = {}
         self._build_surfaces()
 
+    @staticmethod
+    def _alpha_variant(
+        variants: Dict[int, pygame.Surface], base: pygame.Surface, alpha: int
+    ) -> pygame.Surface:
+        """Return a copy of `base` with the given surface alpha, creating it once."""
+        surface = variants.get(alpha)
+        if surface is None:
+            surface = variants[alpha] = base.copy()
+            surface.set_alpha(alpha)
+        return surface
+
     def _build_surfaces(self) -> None:
         tile_size = self.tile_size
         base_size = tile_size
@@ -110,6 +131,22 @@ class DroneSprites:
             max(4, int(tile_size * 0.4)),
         )
 
+        # Match the display's pixel format once a window exists so blits skip conversion.
+        if pygame.display.get_surface() is not None:
+            self._drone_body = self._drone_body.convert_alpha()
+            self._rotor_pod = self._rotor_pod.convert_alpha()
+            self._rotor_blade = self._rotor_blade.convert_alpha()
+            self._drone_shadow_base = self._drone_shadow_base.convert_alpha()
+            self._drone_glow_base = self._drone_glow_base.convert_alpha()
+
+        # Each frame is stored with its half extents so it can be centred without a Rect.
+        self._rotor_frames: List[Tuple[pygame.Surface, int, int]] = []
+        for frame in range(_ROTOR_FRAME_COUNT):
+            rotated = pygame.transform.rotozoom(self._rotor_blade, frame * _ROTOR_FRAME_STEP, 1.0)
+            if pygame.display.get_surface() is not None:
+                rotated = rotated.convert_alpha()
+            self._rotor_frames.append((rotated, rotated.get_width() // 2, rotated.get_height() // 2))
+
     def draw(
         self,
         *,
@@ -122,41 +159,51 @@ class DroneSprites:
     ) -> None:
         """Render the drone for the given agent state."""
         tile_size = self.tile_size
+        agent_id = state.agent_id or 0
+        blit = surface.blit
         grid_x, grid_y = state.position
         base_x = grid_x * tile_size + tile_size // 2
         base_y = grid_y * tile_size + tile_size // 2
 
-        phase = (state.agent_id or 0) * 0.6
+        phase = agent_id * 0.6
         bob_angle = animation_time * bob_speed + phase
-        bob_offset = math.sin(bob_angle) * bob_amplitude
+        bob_sin = math.sin(bob_angle)
+        bob_offset = bob_sin * bob_amplitude
         center_y = base_y - bob_offset
-        height_factor = (math.sin(bob_angle) + 1.0) * 0.5
+        body_center = (base_x, int(center_y))
+        height_factor = (bob_sin + 1.0) * 0.5
 
         shadow_alpha = int(140 - 80 * height_factor)
-        shadow_surface = self._drone_shadow_base.copy()
-        shadow_surface.set_alpha(max(40, min(160, shadow_alpha)))
+        shadow_surface = self._alpha_variant(
+            self._shadow_variants, self._drone_shadow_base, max(40, min(160, shadow_alpha))
+        )
         shadow_center = (
             base_x,
-            grid_y * tile_size + tile_size // 2 + int(tile_size * 0.2),
+            base_y + int(tile_size * 0.2),
+        )
+        blit(shadow_surface, shadow_surface.get_rect(center=shadow_center))
+
+        glow_surface = self._alpha_variant(
+            self._glow_variants, self._drone_glow_base, int(55 + 40 * height_factor)
         )
-        surface.blit(shadow_surface, shadow_surface.get_rect(center=shadow_center))
-
-        glow_surface = self._drone_glow_base.copy()
-        glow_surface.set_alpha(int(55 + 40 * height_factor))
-        glow_rect = glow_surface.get_rect(center=(base_x, int(center_y)))
-        surface.blit(glow_surface, glow_rect)
-
-        body_rect = self._drone_body.get_rect(center=(base_x, int(center_y)))
-        surface.blit(self._drone_body, body_rect)
-
-        rotor_base_angle = (rotor_angle + (state.agent_id or 0) * 12.0) % 360.0
-        for index, (ox, oy) in enumerate(self._rotor_offsets):
-            rotor_center = (base_x + ox, center_y + oy)
-            pod_rect = self._rotor_pod.get_rect(center=(int(rotor_center[0]), int(rotor_center[1])))
-            surface.blit(self._rotor_pod, pod_rect)
-
-            blade_surface = pygame.transform.rotozoom(
-                self._rotor_blade, rotor_base_angle + index * 45.0, 1.0
-            )
-            blade_rect = blade_surface.get_rect(center=(int(rotor_center[0]), int(rotor_center[1])))
-            surface.blit(blade_surface, blade_rect)
+        blit(glow_surface, glow_surface.get_rect(center=body_center))
+
+        drone_body = self._drone_body
+        blit(drone_body, drone_body.get_rect(center=body_center))
+
+        # The rotor angle is snapped to the frame grid once; blades index from there.
+        rotor_frame = int(((rotor_angle + agent_id * 12.0) % 360.0) // _ROTOR_FRAME_STEP)
+        # Pods and blades are queued in drawing order and submitted in a single call.
+        rotor_pod = self._rotor_pod
+        rotor_frames = self._rotor_frames
+        rotor_blits = []
+        for (ox, oy), frame_offset in zip(self._rotor_offsets, _BLADE_FRAME_OFFSETS):
+            rotor_x = int(base_x + ox)
+            rotor_y = int(center_y + oy)
+            rotor_blits.append((rotor_pod, rotor_pod.get_rect(center=(rotor_x, rotor_y))))
+
+            blade_surface, half_width, half_height = rotor_frames[
+                (rotor_frame + frame_offset) % _ROTOR_FRAME_COUNT
+            ]
+            rotor_blits.append((blade_surface, (rotor_x - half_width, rotor_y - half_height)))
+        surface.blits(rotor_blits, doreturn=False)
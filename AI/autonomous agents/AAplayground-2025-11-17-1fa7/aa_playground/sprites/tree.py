@@ -23,7 +23,9 @@ class TreeSprites:
 
     def __init__(self, tile_size: int) -> None:
         self.tile_size = tile_size
-        self._states: Dict[Tuple[int, int], Dict[str, float]] = {}
+        # Per-tree sway parameters: (phase, speed, amplitude, gust_phase, gust_speed,
+        # gust_amplitude, vertical_phase, vertical_speed, vertical_amp).
+        self._states: Dict[Tuple[int, int], Tuple[float, ...]] = {}
         self._build_surfaces()
 
     def _build_surfaces(self) -> None:
@@ -82,25 +84,36 @@ class TreeSprites:
             int(lobe_radius * 0.85),
         )
 
+        # Match the display's pixel format once a window exists so blits skip conversion.
+        if pygame.display.get_surface() is not None:
+            self._trunk_surface = self._trunk_surface.convert_alpha()
+            self._canopy_surface = self._canopy_surface.convert_alpha()
+
         self._trunk_half_width = self._trunk_surface.get_width() // 2
         self._canopy_half_width = self._canopy_surface.get_width() // 2
         self._canopy_height = self._canopy_surface.get_height()
 
-    def _state_for(self, position: Tuple[int, int]) -> Dict[str, float]:
-        state = self._states.get(position)
-        if state is None:
-            rng = random.Random(hash(position))
-            amplitude = rng.uniform(self.tile_size * 0.04, self.tile_size * 0.08)
-            state = {
-                "phase": rng.uniform(0, math.tau),
-                "speed": rng.uniform(0.6, 1.1),
-                "amplitude": amplitude,
-                "gust_phase": rng.uniform(0, math.tau),
-                "gust_speed": rng.uniform(0.1, 0.25),
-                "vertical_phase": rng.uniform(0, math.tau),
-                "vertical_amp": rng.uniform(1.0, self.tile_size * 0.05),
-            }
-            self._states[position] = state
+    def _state_for(self, position: Tuple[int, int]) -> Tuple[float, ...]:
+        rng = random.Random(hash(position))
+        amplitude = rng.uniform(self.tile_size * 0.04, self.tile_size * 0.08)
+        phase = rng.uniform(0, math.tau)
+        speed = rng.uniform(0.6, 1.1)
+        gust_phase = rng.uniform(0, math.tau)
+        gust_speed = rng.uniform(0.1, 0.25)
+        vertical_phase = rng.uniform(0, math.tau)
+        vertical_amp = rng.uniform(1.0, self.tile_size * 0.05)
+        state = (
+            phase,
+            speed,
+            amplitude,
+            gust_phase,
+            gust_speed,
+            amplitude * 0.4,
+            vertical_phase,
+            speed * 0.9,
+            vertical_amp,
+        )
+        self._states[position] = state
         return state
 
     def draw(
@@ -111,13 +124,23 @@ class TreeSprites:
         animation_time: float,
     ) -> None:
         """Render the tree inside the specified tile rectangle."""
-        state = self._state_for(position)
-        sway_base = math.sin(animation_time * state["speed"] + state["phase"]) * state["amplitude"]
-        gust = math.sin(animation_time * state["gust_speed"] + state["gust_phase"]) * (state["amplitude"] * 0.4)
-        sway = sway_base + gust
-        vertical_offset = math.sin(
-            animation_time * (state["speed"] * 0.9) + state["vertical_phase"]
-        ) * state["vertical_amp"]
+        state = self._states.get(position) or self._state_for(position)
+        (
+            phase,
+            speed,
+            amplitude,
+            gust_phase,
+            gust_speed,
+            gust_amplitude,
+            vertical_phase,
+            vertical_speed,
+            vertical_amp,
+        ) = state
+        sin = math.sin
+        sway = sin(animation_time * speed + phase) * amplitude + sin(
+            animation_time * gust_speed + gust_phase
+        ) * gust_amplitude
+        vertical_offset = sin(animation_time * vertical_speed + vertical_phase) * vertical_amp
 
         trunk_center_x = _clamp(
             tile_rect.centerx + sway * 0.25,
@@ -47,7 +47,7 @@ class AutoPlantingField(DronePlantingField):
             return
             
         # Get the soil at the current position
-        soil = self._soil[position[1]][position[0]]
+        soil = self._soil_at(position)
         
         # Automatically plant if the soil is empty and agent has seeds
         if soil.stage.value == "empty" and "seed" in state.inventory:
@@ -12,6 +12,8 @@ from typing import Optional
 
 from aa_playground import Action, ActionType, BaseAgent, Direction, Observation
 
+_DIRECTIONS = tuple(Direction)
+
 
 class RandomAgent(BaseAgent):
     """Agent that issues random move commands."""
@@ -22,5 +24,5 @@ class RandomAgent(BaseAgent):
 
     def decide(self, observation: Observation) -> Optional[Action]:
         print(f"Observation received: {observation}")
-        direction = self._rng.choice(list(Direction))
+        direction = self._rng.choice(_DIRECTIONS)
         return Action(ActionType.MOVE, direction=direction)
@@ -1,4 +1,5 @@
 from collections import Counter
+from functools import lru_cache
 import random
 
 
@@ -52,58 +53,59 @@ counter = Counter(text[i:i+3] for i in range(len(text)-3))
 class ThreeGram:
     def __init__(self):
         self.counts = {}
+        # Per ngram: parallel tuples of next chars and their counts, rebuilt after training
+        self.table = {}
+        # Per ngram: every next char repeated by its count, so a weighted draw is one random.choice
+        self.samples = {}
+        # Per ngram: total count of next chars, so probabilities need no extra pass
+        self.totals = {}
 
     def train(self, text):
-        for i in range(len(text) - 3):
-            ngram = text[i:i+3]
-            next_char = text[i+3]
+        # Count every 4-character window in one pass, then split it into ngram + next char
+        fourgrams = Counter(zip(text, text[1:], text[2:], text[3:]))
+        for (a, b, c, next_char), count in fourgrams.items():
+            ngram = a + b + c
             if ngram not in self.counts:
                 self.counts[ngram] = Counter()
-            self.counts[ngram][next_char] += 1
+            self.counts[ngram][next_char] += count
+        self.table = {ngram: (tuple(counter.keys()), tuple(counter.values()))
+                      for ngram, counter in self.counts.items()}
+        self.samples = {ngram: ''.join(char * count for char, count in zip(chars, weights))
+                        for ngram, (chars, weights) in self.table.items()}
+        self.totals = {ngram: sum(weights) for ngram, (chars, weights) in self.table.items()}
     def next_token_probability(self, ngram):
         #Compute the probability distribution of next token
-        if ngram not in self.counts:
+        if ngram not in self.table:
             return None
-        next_chars = self.counts[ngram]
-        total = next_chars.total()
-        next_char_prob = {char: count/total for char, count in next_chars.items()}
+        chars, weights = self.table[ngram]
+        total = self.totals[ngram]
+        next_char_prob = {char: count/total for char, count in zip(chars, weights)}
         return next_char_prob
     def generate_next_char(self, context, randomize=True):
         context_window = context[-3:]
-        if context_window not in self.counts:
+        if context_window not in self.table:
             return None
-        counter = self.counts[context_window]
         if randomize:
-            chars, weights = list(counter.keys()), list(counter.values())
-            sample = random.sample(chars, 1, counts=weights)
-            return(sample[0])
+            return random.choice(self.samples[context_window])
         else:
-            out = counter.most_common(1)[0][0]
+            out = self.counts[context_window].most_common(1)[0][0]
             return out
     def generate_text(self, prompt, length=20):
         current_ngram = prompt[-3:]
-        output = prompt
+        output = [prompt]
         for i in range(length):
             
             next_char = self.generate_next_char(current_ngram)
             if next_char is None:
                 break
-            output += next_char
-            current_ngram = output[-3:]
-        return output
+            output.append(next_char)
+            current_ngram = current_ngram[1:] + next_char #Slide the window one char
+        return ''.join(output)
 
+@lru_cache(maxsize=8)
 def read_textfile(filepath):
-    text = ''
     with open(filepath, 'r', encoding='utf-8') as f:
-        skip_line = False
-        for line in f.readlines():
-            '''if 'START OF THE PROJECT GUTENBERG' in line:
-                skip_line = False
-                continue
-            if 'END OF THE PROJECT GUTENBERG' in line:
-                skip_line = True'''
-            if not skip_line:
-                text += line
+        text = f.read()
     return text
 
 text = read_textfile('training_corpus_20000.txt')
@@ -4,18 +4,15 @@
 
 
 import math
+import numpy as np
 
 def tabell(x, z):
-    #Skapar variabler
-    år = []
-    vikt = []
-    te_sum = 0
-
-    for i in range(0, len(x)):
-        te_sum += z[i]    #Summan av alla års värden
-        if x[i] % 5 == 0 or i == 0 or i == len(x)-1:    #Sparar dom åren som ska skrivas ut
-            år.append(x[i])
-            vikt.append(te_sum)
+    x = np.asarray(x)
+    summa = np.cumsum(z)    #Summan av alla års värden fram till och med varje år
+    visas = x % 5 == 0    #Sparar dom åren som ska skrivas ut
+    visas[0] = visas[-1] = True    #Första och sista året visas alltid
+    år = x[visas].tolist()
+    vikt = summa[visas].tolist()
     längsta = str(math.floor(max(vikt))) + '.xx'    #Beräknar antalet tecken i det längsta talet efter avrundning
 
     print(f'Ackumulerad tekonsumtion\n[kg/person sedan {x[0]}]\n===========================') #Skriver titel baserat på första året med data
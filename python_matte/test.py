@@ -13,8 +13,10 @@ def sin_taylor(x, i):
     if x > math.pi/2: #Flyttar argumentet till 0 <= x <= pi/2
         x = math.pi-x #Enligt sin(pi-x) = sin(x)
     sin_sum = 0 #Sätter taylorpolynomets summa till 0
+    term = x #Första termen x^1/1!
     for n in range(i): #Loopar det valda antalet varv
-        sin_sum += ((((-1)**n)/(math.factorial(2*n+1)))*(x**(2*n+1))) #Maclaurinpolynom för sinus
+        sin_sum += term #Maclaurinpolynom för sinus
+        term *= -x*x/((2*n+2)*(2*n+3)) #Nästa term ur den förra, utan fakultet och potens
     return(sin_sum*tecken) #Returnerar polynomets summa med rätt tecken
 
 def cos_taylor(x, i):
@@ -29,8 +31,39 @@ def cos_taylor(x, i):
     
 
     cos_sum = 0
+    term = 1 #Första termen x^0/0!
     for n in range(i):
-        cos_sum += (((-1)**n)/(math.factorial(2*n)))*(x**(2*n))
+        cos_sum += term
+        term *= -x*x/((2*n+1)*(2*n+2)) #Nästa term ur den förra
+    return(tecken*cos_sum)
+
+
+def sin_taylor_vec(x, i):
+    x = np.array(x, dtype=float) #Samma steg som sin_taylor men för en hel array på en gång
+    varv = x >= 2*math.pi
+    x[varv] -= 2*math.pi*np.floor(x[varv]/(2*math.pi)) #Alla hela varv bort i ett steg
+    tecken = np.where(x > math.pi, -1, 1)
+    x = np.where(x > math.pi, math.pi*2 - x, x)
+    x = np.where(x > math.pi/2, math.pi - x, x)
+    sin_sum = np.zeros_like(x)
+    term = x.copy()
+    for n in range(i):
+        sin_sum += term
+        term *= -x*x/((2*n+2)*(2*n+3))
+    return(sin_sum*tecken)
+
+def cos_taylor_vec(x, i):
+    x = np.array(x, dtype=float) #Samma steg som cos_taylor men för en hel array på en gång
+    varv = x >= 2*math.pi
+    x[varv] -= 2*math.pi*np.floor(x[varv]/(2*math.pi))
+    x = np.where(x > math.pi, 2*math.pi - x, x)
+    tecken = np.where(x > math.pi/2, -1, 1)
+    x = np.where(x > math.pi/2, math.pi - x, x)
+    cos_sum = np.zeros_like(x)
+    term = np.ones_like(x)
+    for n in range(i):
+        cos_sum += term
+        term *= -x*x/((2*n+1)*(2*n+2))
     return(tecken*cos_sum)
 
 
@@ -41,12 +74,9 @@ print(sin_taylor(-1*math.pi/4, 100))
 
 
 x = np.linspace(-10, 10, 1000)
-y = []
-y1 = []
 n = 100
-for i in x:
-    y.append(cos_taylor(i, n))
-    y1.append(sin_taylor(i, n))
+y = cos_taylor_vec(x, n)
+y1 = sin_taylor_vec(x, n)
 fig, ax = plt.subplots()
 ax.set_xlim(-10, 10)
 ax.set_xticks([-3*math.pi, -2*math.pi, -1*math.pi, 0,  math.pi, 2*math.pi, 3*math.pi])
@@ -15,18 +15,11 @@ ax.legend()
 
 
 
-bra = []
-xbra = []
-dålig = []
-xdålig = []
-for i in range(len(x)):
-    if abs(y2[i] - y1[i]) > 2:
-        dålig.append(y2[i])
-        xdålig.append(x[i])
-
-    else:
-        bra.append(y2[i])
-        xbra.append(x[i])
+dålig_mask = (df['riktig'] - df['teoretisk']).abs() > 2 #En jämförelse för hela kolumnen
+dålig = df['riktig'][dålig_mask]
+xdålig = df['x'][dålig_mask]
+bra = df['riktig'][~dålig_mask]
+xbra = df['x'][~dålig_mask]
 
 
 fig1, ax1 = plt.subplots()
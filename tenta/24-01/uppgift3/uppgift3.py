@@ -8,12 +8,21 @@ def sqrtHeron(S, xold, tol):
         i += 1
     return(x, i+1, abs(x - xold)/xold)
 
-approximation_save = []
-n_save = []
-for i in range(1, 51):
-    temp = sqrtHeron(i, i, 10**-2)
-    approximation_save.append(temp[0])
-    n_save.append(temp[1])
+def sqrtHeron_vec(S, tol):
+    # Samma iteration som sqrtHeron, men för alla S samtidigt; bara de som inte konvergerat uppdateras
+    S = np.asarray(S, dtype=float)
+    xold = S.copy()
+    x = 0.5*(xold + S/xold)
+    n = np.ones(len(S), dtype=int)
+    active = np.abs(x - xold)/xold > tol
+    while active.any():
+        xold[active] = x[active]
+        x[active] = 0.5*(xold[active] + S[active]/xold[active])
+        n[active] += 1
+        active[active] = np.abs(x[active] - xold[active])/xold[active] > tol
+    return(x, n)
+
+approximation_save, n_save = sqrtHeron_vec(np.arange(1, 51), 10**-2)
 for i in range(1, 51):
     if i % 10 == 0 or i == 1:
         print(f'{str(i).rjust(2)}    {n_save[i-1]}    {np.sqrt(i): .5f}    {approximation_save[i-1]: .5f}')
\ No newline at end of file
@@ -2,14 +2,10 @@ import pandas as pd
 import matplotlib.pyplot as plt
 df = pd.read_csv('sommar_os.csv', sep=';')
 
-highest = 0
+kvot = df['Totalt']/df['Deltagare'] #Hela kolumnen på en gång; 0/0 blir NaN och hoppas över av idxmax
 year = ''
-
-for i in range(len(df)):
-   
-    if df.loc[i]['Totalt']/df.loc[i]['Deltagare'] > highest:
-        highest = float(df.loc[i]['Totalt'])/float(df.loc[i]['Deltagare'])
-        year = df.loc[i]['Spel'].split()[0]
+if (kvot > 0).any():  #Som förut vinner bara en kvot över 0; bara NaN eller 0 ger inget år
+    year = df['Spel'][kvot.idxmax()].split()[0]
 
 print(year)
 
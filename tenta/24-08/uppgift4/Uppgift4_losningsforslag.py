@@ -4,31 +4,23 @@ import numpy as np
 
 # a)
 # linjärt ekvationssystem - skriv på matrisform
-A = np.matrix([[1, 1, -1], [3, 4, -2], [-2, 1, 3]], float)
-b = np.matrix([[1], [2], [0]], float)
+A = np.array([[1, 1, -1], [3, 4, -2], [-2, 1, 3]], float)
+b = np.array([1, 2, 0], float)
 x = np.linalg.solve(A, b)
 print('a) Lösningen är:')
 variables = list('xyz')
 for i in range(len(variables)):
-    print(f'{variables[i]} = {x.item(i):.2f}')
+    print(f'{variables[i]} = {x[i]:.2f}')
 
 # b)
 mening = input('b) Skriv ett ord: ')
 mening = mening.lower()
 
 # c)
-vokaler = 'aouåeiyäö'
-index_vokaler = [i for i in range(len(mening)) if mening[i] in vokaler]
-ny_mening = []
-for i in range(len(mening)):
-    if i in index_vokaler:
-        if i >= 10:
-            ny_mening.append(f'{i % 10}')
-        else:
-            ny_mening.append(f'{i}')
-    else:
-        ny_mening.append(mening[i])
-ny_mening = ''.join(ny_mening)
+# en vokal ersätts med sista siffran i sitt index; i % 10 == i för i < 10
+vokaler = set('aouåeiyäö')
+ny_mening = ''.join(str(i % 10) if bokstav in vokaler else bokstav
+                    for i, bokstav in enumerate(mening))
 
 # d)
 for i, bokstav in enumerate(ny_mening):
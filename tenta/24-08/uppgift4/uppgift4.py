@@ -1,24 +1,22 @@
-from scipy import optimize
+import numpy as np
 
 s = input('Skriv ett ord: ').lower()
 l = list(s)
-vokal = 'aouåeiyäö'
-for i in range(len(l)):
-    if l[i] in vokal:
-        l[i] = str(i)[-1]
+vokal = frozenset('aouåeiyäö')
+for i, bokstav in enumerate(l):
+    if bokstav in vokal:
+        l[i] = str(i % 10)
 
-s = ''.join(str(i) for i in l)
+s = ''.join(l)
 
-for i in range(len(s)):
-    print(f'{i} - {s[i]}')
+for i, bokstav in enumerate(s):
+    print(f'{i} - {bokstav}')
 
 
 
 
-def f(x_in):
-    x = x_in[0]
-    y = x_in[1]
-    z = x_in[2]
-    return([x+y-z-1, 3*x+4*y-2*z-2, -2*x+y+3*z])
-sol = optimize.root(f, [-10, -10, -10])
-print('x =', sol.x[0], 'y=', sol.x[1], 'z=', sol.x[2])
\ No newline at end of file
+#Systemet är linjärt, så det löses direkt på matrisform
+A = np.array([[1, 1, -1], [3, 4, -2], [-2, 1, 3]], float)
+b = np.array([1, 2, 0], float)
+x, y, z = np.linalg.solve(A, b)
+print('x =', x, 'y=', y, 'z=', z)
\ No newline at end of file
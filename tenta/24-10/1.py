@@ -1,40 +1,42 @@
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy import optimize
-from scipy import integrate
 
 
 def f(x):
-   return(2.1 + x**2 - np.cos(x))
+   return(2.1 + x*x - np.cos(x))
 def g(x):
    return(np.exp(x))
 def h(x):
-   return((125/17) - x**3)
+   return((125/17) - x*x*x)
 x = np.linspace(0, 2, 2000)
+fx, gx, hx = f(x), g(x), h(x)    #Kurvorna räknas ut en gång och återanvänds i plotten
 
-def point(x):
-   return(f(x)-(g(x)))
-def point1(x):
-   return(g(x)-h(x))
-sol = optimize.root(point, 0)
-x1= sol.x[0]
+def skärning(d):
+   # första teckenbytet i d på gridden, förfinat med linjär interpolation mellan grannpunkterna
+   i = np.where(np.diff(np.sign(d)))[0][0]
+   return(x[i] - d[i]*(x[i+1] - x[i])/(d[i+1] - d[i]))
+# båda skillnaderna byter tecken exakt en gång på [0, 2]
+x1 = skärning(fx - gx)
 y1 = f(x1)
-sol = optimize.root(point1, 0)
-x2 = sol.x[0]
+x2 = skärning(gx - hx)
 y2 = g(x2) 
 
-q = integrate.quad(g, x1, x2)     
+# Gauss-Legendre med 16 noder räcker för exp på ett kort intervall; noder och vikter tas fram en gång
+noder, vikter = np.polynomial.legendre.leggauss(16)
+halva = (x2 - x1)/2
+mitt = (x1 + x2)/2
+A = halva*np.dot(vikter, g(mitt + halva*noder))
 
 fig, ax = plt.subplots()
-ax.plot(x, f(x), 'g', linewidth= 2, label= 'f(x)')
-ax.plot(x, g(x), 'b', linewidth= 2, label= 'g(x)')
-ax.plot(x, h(x), 'r', linewidth= 2, label= 'h(x)')
+ax.plot(x, fx, 'g', linewidth= 2, label= 'f(x)')
+ax.plot(x, gx, 'b', linewidth= 2, label= 'g(x)')
+ax.plot(x, hx, 'r', linewidth= 2, label= 'h(x)')
 ax.legend(loc='lower center')
 ax.set_xlabel('X', fontsize=18)
 ax.set_ylabel('f(x), g(x), h(x)', fontsize=18)
 plt.plot(x1, y1, 'k', marker='s')
 plt.plot(x2, y2, 'k', marker='s')
-ax.set_title(f'Integralen A = {q[0]: .2f}')
+ax.set_title(f'Integralen A = {A: .2f}')
 plt.xticks(fontsize=16)
 plt.yticks(fontsize=16)
 
@@ -1,10 +1,8 @@
-from scipy import optimize
-def f(x_in):
-    x = x_in[0]
-    y = x_in[1]
-    z = x_in[2]
-    return([x-2*y+3*z-9, 
-            -1*x+3*y-z+6, 
-            2*x-5*y+5*z-17])
-sol = optimize.root(f, [0, 0, 0])
-print(f'x = {sol.x[0]}, y = {sol.x[1]}, z = {sol.x[2]}')
\ No newline at end of file
+import numpy as np
+#Systemet är linjärt, så det löses direkt på matrisform
+A = np.array([[1, -2, 3],
+              [-1, 3, -1],
+              [2, -5, 5]], float)
+b = np.array([9, -6, 17], float)
+x, y, z = np.linalg.solve(A, b)
+print(f'x = {x}, y = {y}, z = {z}')
@@ -9,15 +9,16 @@
 # Beskrivning av Uppgift3: 
 #
 
+from math import isqrt
+
 def is_prime(n):
-    if n < 1:
-        return False
-    if n == 2 or n == 1:
-        return True
-    if n % 2 == 0:
+    if n < 2:
         return False
-    for i in range(3, int(n**0.5)+1, 2):
-        if n % i == 0:
+    if n % 2 == 0 or n % 3 == 0:
+        return n == 2 or n == 3
+    # alla primtal > 3 är på formen 6k-1 eller 6k+1, så bara de delarna prövas
+    for i in range(5, isqrt(n)+1, 6):
+        if n % i == 0 or n % (i+2) == 0:
             return False
     return True
 
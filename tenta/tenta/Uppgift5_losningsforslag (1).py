@@ -1,5 +1,3 @@
-import egenfunktion
-
 # filnamn = 'test.txt'
 filnamn = 'input.txt'
 
@@ -16,44 +14,56 @@ for rad in data:
     else:
         lyckokarta.append([delar[0], -int(delar[4]), delar[-1]])
 
-# ta fram alla unika namn
-namn = list(set([e[0] for e in lyckokarta]))
-
-# ta fram alla unika kombinationer
-# notera att placeringen saknar riktning -- det enda viktiga är vilka grannar man har
-kombinationer = egenfunktion.circular_permutations_nodir(namn)
-
-# utvärdera alla kombinationer
-kombinationspoäng = []
-for kombination in kombinationer:
-    summa = 0
-    for i, n1 in enumerate(kombination):
-        for regel in lyckokarta:
-            if (n1 == regel[0]):
-                if (i < (len(kombination)-1)):
-                    if (kombination[i+1] == regel[2]):
-                        summa += regel[1]
-                else:
-                    if (kombination[0] == regel[2]):
-                        summa += regel[1]
-                if (i == 0):
-                    if (kombination[-1] == regel[2]):
-                        summa += regel[1]
-                else:
-                    if (kombination[i-1] == regel[2]):
-                        summa += regel[1]
-    kombinationspoäng.append(summa)
-
-# testutskrift av alla kombinationer och poäng, kommenteras bort när klar
-# for i, kombination in enumerate(kombinationer):
-#     for namn in kombination:
-#         print(namn, end=' ')
-#     print(f' = {kombinationspoäng[i]}')
-
-# skriv ut optimala placeringen och dess poäng
-index_optimal = kombinationspoäng.index(max(kombinationspoäng))
+# ta fram alla unika namn, även grannar som bara förekommer sist på en rad;
+# sorterat så att lika bra placeringar alltid ger samma svar
+namn = sorted({e[0] for e in lyckokarta} | {e[2] for e in lyckokarta})
+
+# vikter mellan alla par; placeringen saknar riktning så båda hållens lycka räknas på kanten
+index = {person: i for i, person in enumerate(namn)}
+n = len(namn)
+vikt = [[0]*n for _ in range(n)]
+for person, poäng, granne in lyckokarta:
+    vikt[index[person]][index[granne]] += poäng
+    vikt[index[granne]][index[person]] += poäng
+
+# dynamisk programmering (Held-Karp) i stället för att pröva alla (n-1)!/2 placeringar:
+# bästa[mask][j] = högsta poäng för en kedja som börjar i namn[0], besöker personerna i mask och slutar i j
+INGEN = float('-inf')
+bästa = [[INGEN]*n for _ in range(1 << n)]
+förra = [[-1]*n for _ in range(1 << n)]
+bästa[1][0] = 0
+for mask in range(1, 1 << n, 2):
+    for j in range(n):
+        poäng = bästa[mask][j]
+        if poäng == INGEN:
+            continue
+        for k in range(n):
+            if mask & (1 << k):
+                continue
+            ny_mask = mask | (1 << k)
+            if poäng + vikt[j][k] > bästa[ny_mask][k]:
+                bästa[ny_mask][k] = poäng + vikt[j][k]
+                förra[ny_mask][k] = j
+
+# stäng ringen tillbaka till namn[0] och välj bästa sista person
+alla = (1 << n) - 1
+sist = max(range(n), key=lambda j: bästa[alla][j] + vikt[j][0])
+poäng_optimal = bästa[alla][sist] + vikt[sist][0]
+
+# följ förra-pekarna bakåt för att få placeringen
+placering = []
+mask, j = alla, sist
+while j != -1:
+    placering.append(namn[j])
+    mask, j = mask ^ (1 << j), förra[mask][j]
+placering.reverse()
+
+# skriv ut på samma "kanoniska" form som tidigare: minsta rotationen, även spegelvänd
+spegel = placering[::-1]
+placering = min([placering[i:] + placering[:i] for i in range(n)] +
+                [spegel[i:] + spegel[:i] for i in range(n)])
 
 print('Den optimala placeringen är:')
-for namn in kombinationer[index_optimal]:
+for namn in placering:
     print(namn, end=' ')
-print(f'({kombinationspoäng[index_optimal]} lyckoenheter)')
\ No newline at end of file
+print(f'({poäng_optimal} lyckoenheter)')
@@ -1,22 +1,42 @@
 import itertools
 
+def minsta_rotation(t):
+    # går igenom rotationerna med ett löpande minimum i stället för att spara alla
+    n = len(t)
+    dubbel = t + t
+    bästa = t
+    for i in range(1, n):
+        kandidat = dubbel[i:i+n]
+        if kandidat < bästa:
+            bästa = kandidat
+    return bästa
+
 def circular_permutations_nodir(lst):
     n = len(lst)
-    perms = set(itertools.permutations(lst))
+    if len(set(lst)) == n:
+        # unika element: den kanoniska formen börjar alltid med minsta elementet och har
+        # den mindre grannen på andra plats, så bara de (n-1)!/2 ordningarna genereras
+        if n < 3:
+            return [sorted(lst)]
+        first = min(lst)
+        rest = [e for e in lst if e != first]
+        return [[first, *p] for p in itertools.permutations(rest) if p[0] < p[-1]]
+
+    # varje placering har en rotation som börjar med minsta elementet, så det hålls fast
+    # först och bara resten permuteras: (n-1)! ordningar i stället för n!
+    first = min(lst)
+    rest = list(lst)
+    rest.remove(first)
+    perms = [(first,) + p for p in set(itertools.permutations(rest))]
     unique = set()
     result = []
     
     for p in perms:
-        # skapa alla rotationer för p och för den spegelvända
-        rotations = [tuple(p[i:] + p[:i]) for i in range(n)]
-        mirrored = tuple(reversed(p))
-        mirror_rotations = [tuple(mirrored[i:] + mirrored[:i]) for i in range(n)]
-        
         # välj en "kanonisk" representation: minsta av alla rotationer (inklusive spegel)
-        rep = min(rotations + mirror_rotations)
+        rep = min(minsta_rotation(p), minsta_rotation(p[::-1]))
         
         if rep not in unique:
             unique.add(rep)
             result.append(list(rep))
     
-    return result
\ No newline at end of file
+    return result